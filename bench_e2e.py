@@ -0,0 +1,342 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from typing import Any, Dict, Iterator, List, Optional
+
+from main import BASE, AESScraper, FixtureStore, aiohttp
+from mock_server import serve
+
+FORMATS = ("xlsx", "csv", "jsonl", "parquet", "arrow", "sqlite")
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of ``values`` (0 < q <= 100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+class TimedScraper(AESScraper):
+    """AESScraper that records the wall time of every HTTP request it makes.
+
+    Only the request itself is timed, never the wait for a worker slot, so
+    latencies compare across engines. A requests call includes urllib3's
+    retries; on the async engine each attempt is timed separately.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latencies: List[float] = []
+
+    def _get_body(self, url: str) -> bytes:
+        t0 = time.perf_counter()
+        try:
+            return super()._get_body(url)
+        finally:
+            self.latencies.append(time.perf_counter() - t0)
+
+    def _fetch_listing_page(self, skip: int, top: int) -> Dict[str, Any]:
+        t0 = time.perf_counter()
+        try:
+            return super()._fetch_listing_page(skip, top)
+        finally:
+            self.latencies.append(time.perf_counter() - t0)
+
+    def _stream_listing_page(
+        self, skip: int, top: int, meta: Dict[str, Any]
+    ) -> Iterator[dict]:
+        t0 = time.perf_counter()
+        try:
+            yield from super()._stream_listing_page(skip, top, meta)
+        finally:
+            self.latencies.append(time.perf_counter() - t0)
+
+    async def _get_body_async(self, client, sem, url: str) -> bytes:
+        # Time each client.get itself; the semaphore wait in the base method
+        # is queueing, which the thread engine's executor hides the same way.
+        # With --replay the client is main.ReplayClient, so replayed requests
+        # are timed here too, like ThrottledAdapter's replay under _get_body.
+        return await super()._get_body_async(
+            _TimedClient(client, self.latencies), sem, url
+        )
+
+
+class _TimedClient:
+    """Wraps an aiohttp session so every ``get`` is timed from send to body read."""
+
+    def __init__(self, client, latencies: List[float]):
+        self.client = client
+        self.latencies = latencies
+
+    def get(self, url: str, **kwargs) -> "_TimedRequest":
+        return _TimedRequest(self.client.get(url, **kwargs), self.latencies)
+
+
+class _TimedRequest:
+    def __init__(self, request, latencies: List[float]):
+        self.request = request
+        self.latencies = latencies
+
+    async def __aenter__(self):
+        self.started = time.perf_counter()
+        return await self.request.__aenter__()
+
+    async def __aexit__(self, *exc):
+        try:
+            return await self.request.__aexit__(*exc)
+        finally:
+            self.latencies.append(time.perf_counter() - self.started)
+
+
+def run_case(case: Dict[str, Any], target: Dict[str, Any]) -> Dict[str, Any]:
+    """One AESScraper.run in a fresh process, so peak RSS belongs to this case."""
+    fixtures = None
+    if target.get("replay"):
+        fixtures = FixtureStore(
+            target["replay"], "replay", target["latency"], target["jitter"]
+        )
+    scraper = TimedScraper(
+        delay_sec=0,
+        base=target["base"],
+        fixtures=fixtures,
+        is_past_events=target["past_events"],
+    )
+    workdir = tempfile.mkdtemp(prefix="aes-bench-")
+    try:
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            summary = scraper.run(
+                os.path.join(workdir, f"bench.{case['format']}"),
+                workers=case["workers"],
+                engine=case["engine"],
+                fmt=case["format"],
+            )
+        wall = time.perf_counter() - started
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    latencies = scraper.latencies
+    return {
+        **case,
+        "events": summary["events"],
+        "divisions": summary["divisions"],
+        "errors": summary["event_errors"] + summary["division_errors"],
+        "requests": len(latencies),
+        "wall_seconds": wall,
+        "events_per_sec": summary["events"] / wall if wall else None,
+        "requests_per_sec": len(latencies) / wall if wall else None,
+        "latency_ms": {
+            name: (value * 1000 if value is not None else None)
+            for name, value in (
+                ("p50", percentile(latencies, 50)),
+                ("p95", percentile(latencies, 95)),
+                ("p99", percentile(latencies, 99)),
+            )
+        },
+        "export_seconds": summary["export_seconds"],
+        # ru_maxrss is KiB on Linux, bytes on macOS.
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        / (1024 * 1024 if sys.platform == "darwin" else 1024),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _csv_list(kind):
+    return lambda value: [kind(v) for v in value.split(",") if v]
+
+
+def _case_key(result: Dict[str, Any]):
+    return result["engine"], result["workers"], result["format"]
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: str) -> None:
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    before = {}
+    for row in baseline["results"]:
+        before.setdefault(_case_key(row), []).append(row["events_per_sec"] or 0)
+    print(f"Compared with {baseline_path} (commit {baseline.get('commit')}):")
+    for row in results:
+        old = before.get(_case_key(row))
+        if not old or not row["events_per_sec"]:
+            continue
+        ratio = row["events_per_sec"] / (sum(old) / len(old))
+        flag = "  <-- regression" if ratio < 0.9 else ""
+        print(
+            f"  {row['engine']:>6} w={row['workers']:<4} {row['format']:<8} "
+            f"{ratio:6.2f}x events/s{flag}"
+        )
+
+
+def main():
+    p = argparse.ArgumentParser(
+        description="Benchmark AESScraper.run end to end against mock_server.py or recorded fixtures"
+    )
+    p.add_argument(
+        "--workers", type=_csv_list(int), default=[4, 16, 64], help="e.g. 4,16,64"
+    )
+    p.add_argument(
+        "--engines",
+        type=_csv_list(str),
+        default=["thread", "async"],
+        help="e.g. thread,async",
+    )
+    p.add_argument(
+        "--formats",
+        type=_csv_list(str),
+        default=["csv", "xlsx"],
+        help=f"Any of {','.join(FORMATS)}",
+    )
+    p.add_argument("--repeat", type=int, default=1, help="Runs per matrix cell")
+    p.add_argument(
+        "--replay",
+        default=None,
+        help="Replay a --record fixtures directory instead of starting the mock server",
+    )
+    p.add_argument(
+        "--base",
+        default=BASE,
+        help="API root the --replay fixtures were recorded against",
+    )
+    p.add_argument("--replay-latency", type=float, default=0.0)
+    p.add_argument("--replay-jitter", type=float, default=0.0)
+    p.add_argument("--past_events", action="store_true", help="Fetch past events")
+    p.add_argument("--events", type=int, default=2000, help="Mock dataset size")
+    p.add_argument("--divisions", type=int, default=6, help="Mock divisions per event")
+    p.add_argument(
+        "--latency",
+        choices=["fixed", "uniform", "exponential", "lognormal"],
+        default="lognormal",
+        help="Mock response delay distribution",
+    )
+    p.add_argument(
+        "--latency-ms", type=float, default=20.0, help="Mean mock response delay"
+    )
+    p.add_argument("--error-rate", type=float, default=0.0)
+    p.add_argument(
+        "--output",
+        default=None,
+        help="Results file (default: bench-results/<commit>.json)",
+    )
+    p.add_argument(
+        "--compare", default=None, help="Earlier results file to compare against"
+    )
+    args = p.parse_args()
+
+    bad = [f for f in args.formats if f not in FORMATS]
+    if bad:
+        p.error(f"unsupported --formats: {','.join(bad)}")
+    if "async" in args.engines and aiohttp is None:
+        print("aiohttp is not installed; skipping the async engine")
+        args.engines = [e for e in args.engines if e != "async"]
+
+    server = None
+    if args.replay:
+        target = {
+            "base": args.base,
+            "replay": args.replay,
+            "latency": args.replay_latency,
+            "jitter": args.replay_jitter,
+            "past_events": args.past_events,
+        }
+        source = {"replay": target}
+    else:
+        server = serve(
+            events=args.events,
+            divisions=args.divisions,
+            latency=args.latency,
+            latency_ms=args.latency_ms,
+            error_rate=args.error_rate,
+        )
+        target = {"base": server.url, "past_events": args.past_events}
+        source = {
+            "mock": {
+                "events": args.events,
+                "divisions": args.divisions,
+                "latency": args.latency,
+                "latency_ms": args.latency_ms,
+                "error_rate": args.error_rate,
+            }
+        }
+
+    cases = [
+        {"engine": engine, "workers": workers, "format": fmt}
+        for engine in args.engines
+        for workers in args.workers
+        for fmt in args.formats
+    ]
+    results = []
+    spawn = get_context("spawn")
+    print(
+        f"{'engine':>6} {'workers':>7} {'format':<8} {'events/s':>9} {'req/s':>8} "
+        f"{'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7} {'RSS MB':>7} {'export s':>8}"
+    )
+    try:
+        for case in cases:
+            for _ in range(args.repeat):
+                with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as ex:
+                    row = ex.submit(run_case, case, target).result()
+                results.append(row)
+                lat = row["latency_ms"]
+                print(
+                    f"{row['engine']:>6} {row['workers']:>7} {row['format']:<8} "
+                    f"{row['events_per_sec']:>9,.1f} {row['requests_per_sec']:>8,.1f} "
+                    f"{lat['p50'] or 0:>7.1f} {lat['p95'] or 0:>7.1f} {lat['p99'] or 0:>7.1f} "
+                    f"{row['peak_rss_mb']:>7.1f} {row['export_seconds']:>8.2f}"
+                )
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    commit = _git_commit()
+    output = args.output or os.path.join("bench-results", f"{commit or 'local'}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "commit": commit,
+                "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpus": os.cpu_count(),
+                "source": source,
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+    print(f"Results written to {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import argparse
+import json
+import os
+import time
+
+from main import AESScraper
+
+
+def load_corpus(directory: str):
+    """Raw response bodies under ``directory``, split into details and divisions."""
+    details, divisions = [], []
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            if not name.endswith(".json"):
+                continue
+            with open(os.path.join(root, name), "rb") as f:
+                body = f.read()
+            payload = json.loads(body)
+            if isinstance(payload, list) or (
+                isinstance(payload, dict) and "value" in payload
+            ):
+                # Listing pages also carry "value"; only division lists are wanted.
+                if isinstance(payload, dict) and "@odata.count" in payload:
+                    continue
+                divisions.append(body)
+            else:
+                details.append(body)
+    return details, divisions
+
+
+def bench(scraper: AESScraper, details, divisions, repeat: int):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        events = [scraper.decode_event(b) for b in details]
+        divs = [d for b in divisions for d in scraper.decode_divisions(b)]
+    elapsed = time.perf_counter() - started
+    return elapsed / repeat, events, divs
+
+
+def main():
+    p = argparse.ArgumentParser(
+        description="Compare the dict-walking and msgspec struct parsers on recorded responses"
+    )
+    p.add_argument("corpus", help="Directory of recorded *.json response bodies")
+    p.add_argument("--repeat", type=int, default=5, help="Passes over the corpus")
+    args = p.parse_args()
+
+    details, divisions = load_corpus(args.corpus)
+    print(f"Corpus: {len(details)} event details, {len(divisions)} division lists")
+
+    results = {}
+    for decoder in ("dict", "struct"):
+        scraper = AESScraper(delay_sec=0, decoder=decoder)
+        elapsed, events, divs = bench(scraper, details, divisions, args.repeat)
+        results[decoder] = (events, divs)
+        rate = (len(events) + len(divs)) / elapsed if elapsed else float("inf")
+        print(
+            f"{decoder:>6}: {elapsed * 1000:.1f} ms per pass, {rate:,.0f} records/s "
+            f"({len(events)} events, {len(divs)} divisions)"
+        )
+
+    same = results["dict"] == results["struct"]
+    print("Outputs match" if same else "WARNING: parsers disagree")
+
+
+if __name__ == "__main__":
+    main()
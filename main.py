@@ -1,54 +1,1968 @@
 import argparse
+import asyncio
+import codecs
+import cProfile
+import csv
+import hashlib
 import json
+import os
+import pstats
+import queue
+import random
+import re
+import sqlite3
+import sys
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import asdict, dataclass
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
 
-import pandas as pd
 import requests
+import xlsxwriter
 from requests.adapters import HTTPAdapter, Retry
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import aiohttp
+except ImportError:  # only needed for --engine async
+    aiohttp = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # only needed for --format parquet/arrow
+    pa = pq = None
+
+try:
+    import psycopg
+except ImportError:  # only needed for --format postgres
+    psycopg = None
+
+try:
+    import orjson
+except ImportError:  # optional faster JSON decoding
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional faster JSON decoding
+    msgspec = None
 
 BASE = "https://www.advancedeventsystems.com"
 
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (compatible; AES-Scraper/1.0; +https://example.com)",
-    "Accept": "text/html,application/json",
-}
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; AES-Scraper/1.0; +https://example.com)",
+    "Accept": "text/html,application/json",
+}
+
+# Mirrors the urllib3 Retry config in _build_session for the async engine.
+RETRY_TOTAL = 5
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+# Statuses whose Retry-After header urllib3's Retry honours.
+RETRY_AFTER_STATUSES = frozenset((413, 429, 503))
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _to_int(value: Any) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, str) and "." in value:
+        return int(Decimal(value))
+    return int(value)
+
+
+def _to_decimal(value: Any) -> Optional[Decimal]:
+    if value is None or value == "":
+        return None
+    return Decimal(str(value))
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> Optional[date]:
+    # API dates are ISO timestamps; records journaled by older versions
+    # hold %m/%d/%Y strings.
+    try:
+        return datetime.fromisoformat(value.replace("Z", "")).date()
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(value, "%m/%d/%Y").date()
+    except ValueError:
+        return None
+
+
+def _to_date(value: Any) -> Optional[date]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, date):
+        return value
+    return _parse_date(value)
+
+
+DATE_COLUMNS = ("start_date", "end_date")
+DATE_STYLES = ("us", "iso", "date")
+
+
+@lru_cache(maxsize=4096)
+def format_date(value: Any, style: str = "us") -> Any:
+    """Render a record date for export.
+
+    "us" gives %m/%d/%Y strings (the historical output), "iso" gives
+    YYYY-MM-DD strings and "date" keeps a datetime.date. Memoized, since
+    the same few hundred dates repeat across thousands of events.
+    """
+    d = _to_date(value)
+    if style == "date":
+        return d
+    if d is None:
+        return ""
+    return d.isoformat() if style == "iso" else d.strftime("%m/%d/%Y")
+
+
+def _map_unique(values: List[Any], fn: Callable[[Any], Any]) -> List[Any]:
+    """Apply ``fn`` to a column, calling it once per distinct value."""
+    mapping = {}
+    out = []
+    for v in values:
+        try:
+            out.append(mapping[v])
+        except KeyError:
+            out.append(mapping.setdefault(v, fn(v)))
+    return out
+
+
+@dataclass(frozen=True, slots=True)
+class EventRecord:
+    event_id: Optional[int] = None
+    event_url: Optional[str] = None
+    name: Optional[str] = None
+    tournament_type: Optional[str] = None
+    host: Optional[str] = None
+    location: Optional[str] = None
+    address: Optional[str] = None
+    website: Optional[str] = None
+    email: Optional[str] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "EventRecord":
+        return cls(**{**row, "event_id": _to_int(row.get("event_id"))})
+
+
+@dataclass(frozen=True, slots=True)
+class DivisionRecord:
+    description: Optional[str] = None
+    entry_fee: Optional[Decimal] = None
+    event_division_assignment_id: Optional[int] = None
+    event_id: Optional[int] = None
+    maximum_teams: Optional[int] = None
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "DivisionRecord":
+        return cls(
+            description=row.get("description"),
+            entry_fee=_to_decimal(row.get("entry_fee")),
+            event_division_assignment_id=_to_int(
+                row.get("event_division_assignment_id")
+            ),
+            event_id=_to_int(row.get("event_id")),
+            maximum_teams=_to_int(row.get("maximum_teams")),
+        )
+
+
+EVENT_COLUMNS = [f.name for f in fields(EventRecord)]
+DIVISION_COLUMNS = [f.name for f in fields(DivisionRecord)]
+_EVENT_VALUES = attrgetter(*EVENT_COLUMNS)
+_DIVISION_VALUES = attrgetter(*DIVISION_COLUMNS)
+
+
+def event_row(rec: EventRecord) -> Dict[str, Any]:
+    """Shallow field dict of a record; much cheaper than dataclasses.asdict."""
+    return dict(zip(EVENT_COLUMNS, _EVENT_VALUES(rec)))
+
+
+def division_row(rec: DivisionRecord) -> Dict[str, Any]:
+    return dict(zip(DIVISION_COLUMNS, _DIVISION_VALUES(rec)))
+
+
+ERROR_COLUMNS = ["where", "message", "item"]
+
+TABLE_COLUMNS = {
+    "events": EVENT_COLUMNS,
+    "event_errors": ERROR_COLUMNS,
+    "divisions": DIVISION_COLUMNS,
+    "division_errors": ERROR_COLUMNS,
+}
+
+
+def _tournament_type(affiliation: str, event_type: str) -> str:
+    return (
+        (f"{affiliation} {event_type}").strip() if (affiliation or event_type) else ""
+    )
+
+
+def _format_address(line1: str, city: str, state_abbr: str, zip_code: str) -> str:
+    return f"{line1}\n{city}, {state_abbr} {zip_code}".strip().rstrip(", ")
+
+
+if msgspec is not None:
+    # Typed views of the detail and division payloads. Only the members the
+    # records need are declared; msgspec skips everything else unparsed.
+    # Scalars stay Any so str() of them matches the dict-walking parser.
+
+    class _Described(msgspec.Struct):
+        description: Any = None
+
+    class _State(msgspec.Struct):
+        abbreviation: Any = None
+
+    class _Address(msgspec.Struct):
+        line1: Any = None
+        city: Any = None
+        state: Optional[_State] = None
+        zip: Any = None
+
+    class _EventPayload(msgspec.Struct, rename="camel"):
+        event_id: Any = None
+        name: Any = None
+        affiliation: Optional[_Described] = None
+        event_type: Optional[_Described] = None
+        host_name: Any = None
+        boss_organization_name: Any = None
+        location_name: Any = None
+        address: Optional[_Address] = None
+        website: Any = None
+        email: Any = None
+        start_date: Optional[str] = None
+        end_date: Optional[str] = None
+
+    class _DivisionPayload(msgspec.Struct, rename="camel"):
+        event_id: Any = None
+        description: Any = None
+        entry_fee: Any = None
+        event_division_assignment_id: Any = None
+        maximum_teams: Any = None
+
+    class _DivisionList(msgspec.Struct):
+        value: Optional[List[_DivisionPayload]] = None
+
+    _event_decoder = msgspec.json.Decoder(_EventPayload)
+    _divisions_decoder = msgspec.json.Decoder(
+        Union[List[_DivisionPayload], _DivisionList, None]
+    )
+
+
+def event_from_struct(p: "_EventPayload") -> EventRecord:
+    """Same fields as AESScraper.parse_event_api, from a decoded struct."""
+    event_id = _to_int(p.event_id or None)
+    aff = (p.affiliation.description if p.affiliation else None) or ""
+    et = (p.event_type.description if p.event_type else None) or ""
+    addr = p.address
+    if addr is not None:
+        state_abbr = (addr.state.abbreviation if addr.state else None) or ""
+        address = _format_address(
+            addr.line1 or "", addr.city or "", state_abbr, addr.zip or ""
+        )
+    else:
+        address = _format_address("", "", "", "")
+    return EventRecord(
+        event_id=event_id,
+        event_url=(
+            f"https://www.advancedeventsystems.com/events/{event_id}"
+            if event_id
+            else ""
+        ),
+        name=p.name or "",
+        tournament_type=_tournament_type(aff, et),
+        host=p.host_name or p.boss_organization_name or "",
+        location=p.location_name or "",
+        address=address,
+        website=p.website or "",
+        email=p.email or "",
+        start_date=p.start_date or None,
+        end_date=p.end_date or None,
+    )
+
+
+def division_from_struct(p: "_DivisionPayload") -> DivisionRecord:
+    """Same fields as AESScraper.parse_division_api, from a decoded struct."""
+    return DivisionRecord(
+        description=str(p.description or ""),
+        entry_fee=_to_decimal(p.entry_fee or 0),
+        event_division_assignment_id=_to_int(p.event_division_assignment_id or None),
+        event_id=_to_int(p.event_id or None),
+        maximum_teams=_to_int(p.maximum_teams or None),
+    )
+
+
+class XlsxSink:
+    """Workbook with one sheet per table, written row by row.
+
+    xlsxwriter's constant_memory mode flushes each row to a temp file as
+    soon as the next one starts, so memory stays flat. Error sheets are
+    only added once the first error arrives.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+        self._date_format = self.workbook.add_format({"num_format": "mm/dd/yyyy"})
+        self._sheets: Dict[str, Any] = {}
+        self._rows: Dict[str, int] = {}
+        for table in ("events", "divisions"):
+            self._sheet(table)
+
+    def _sheet(self, table: str):
+        if table not in self._sheets:
+            sheet = self.workbook.add_worksheet(table)
+            sheet.write_row(0, 0, TABLE_COLUMNS[table])
+            self._sheets[table] = sheet
+            self._rows[table] = 1
+        return self._sheets[table]
+
+    def write(self, table: str, row: Dict[str, Any]) -> None:
+        sheet = self._sheet(table)
+        r = self._rows[table]
+        for c, column in enumerate(TABLE_COLUMNS[table]):
+            value = row[column]
+            if isinstance(value, date):
+                sheet.write_datetime(r, c, value, self._date_format)
+            else:
+                sheet.write(r, c, value)
+        self._rows[table] += 1
+
+    def close(self) -> None:
+        self.workbook.close()
+
+
+class CsvSink:
+    """One CSV file per table next to ``path``: <stem>.events.csv, ..."""
+
+    def __init__(self, path: str):
+        self.stem = os.path.splitext(path)[0]
+        self._files: Dict[str, Any] = {}
+        self._writers: Dict[str, Any] = {}
+        for table in ("events", "divisions"):
+            self._writer(table)
+
+    def _writer(self, table: str):
+        if table not in self._writers:
+            f = open(f"{self.stem}.{table}.csv", "w", newline="", encoding="utf-8")
+            writer = csv.DictWriter(f, fieldnames=TABLE_COLUMNS[table])
+            writer.writeheader()
+            self._files[table] = f
+            self._writers[table] = writer
+        return self._writers[table]
+
+    def write(self, table: str, row: Dict[str, Any]) -> None:
+        self._writer(table).writerow(row)
+
+    def close(self) -> None:
+        for f in self._files.values():
+            f.close()
+
+
+class JsonLinesSink:
+    """One JSON Lines file per table next to ``path``: <stem>.events.jsonl, ..."""
+
+    def __init__(self, path: str):
+        self.stem = os.path.splitext(path)[0]
+        self._files: Dict[str, Any] = {}
+        for table in ("events", "divisions"):
+            self._file(table)
+
+    def _file(self, table: str):
+        if table not in self._files:
+            self._files[table] = open(
+                f"{self.stem}.{table}.jsonl", "w", encoding="utf-8"
+            )
+        return self._files[table]
+
+    def write(self, table: str, row: Dict[str, Any]) -> None:
+        f = self._file(table)
+        f.write(json.dumps(row, default=str))
+        f.write("\n")
+
+    def close(self) -> None:
+        for f in self._files.values():
+            f.close()
+
+
+def _arrow_tables() -> Dict[str, Tuple[Any, Dict[str, Callable[[Any], Any]]]]:
+    """Arrow schema and per-column converters for each output table."""
+    text = pa.string()
+    errors = pa.schema([(c, text) for c in ERROR_COLUMNS])
+    return {
+        "events": (
+            pa.schema(
+                [
+                    ("event_id", pa.int64()),
+                    ("event_url", text),
+                    ("name", text),
+                    ("tournament_type", text),
+                    ("host", text),
+                    ("location", text),
+                    ("address", text),
+                    ("website", text),
+                    ("email", text),
+                    ("start_date", pa.date32()),
+                    ("end_date", pa.date32()),
+                ]
+            ),
+            {"event_id": _to_int, "start_date": _to_date, "end_date": _to_date},
+        ),
+        "divisions": (
+            pa.schema(
+                [
+                    ("description", text),
+                    ("entry_fee", pa.decimal128(12, 2)),
+                    ("event_division_assignment_id", pa.int64()),
+                    ("event_id", pa.int64()),
+                    ("maximum_teams", pa.int32()),
+                ]
+            ),
+            {
+                "entry_fee": _to_decimal,
+                "event_division_assignment_id": _to_int,
+                "event_id": _to_int,
+                "maximum_teams": _to_int,
+            },
+        ),
+        "event_errors": (errors, {}),
+        "division_errors": (errors, {}),
+    }
+
+
+class ColumnBuffer:
+    """Rows accumulated column-wise, one list per field.
+
+    Records are appended straight from their attributes (append_record),
+    so no intermediate dict (or asdict copy) is built per row, and handed
+    over as an Arrow record batch.
+    """
+
+    def __init__(self, columns: List[str]):
+        self.columns = list(columns)
+        self.data: Dict[str, List[Any]] = {c: [] for c in self.columns}
+        self._appends = [self.data[c].append for c in self.columns]
+        self._values = attrgetter(*self.columns)
+
+    def __len__(self) -> int:
+        return len(self.data[self.columns[0]])
+
+    def append(self, row: Dict[str, Any]) -> None:
+        for column, append in zip(self.columns, self._appends):
+            append(row.get(column))
+
+    def append_record(self, rec: Any) -> None:
+        values = self._values(rec)
+        if len(self.columns) == 1:
+            values = (values,)
+        for append, value in zip(self._appends, values):
+            append(value)
+
+    def to_arrow(
+        self,
+        schema: Any,
+        converters: Optional[Dict[str, Callable[[Any], Any]]] = None,
+    ) -> Any:
+        arrays = []
+        for field in schema:
+            values = self.data[field.name]
+            convert = (converters or {}).get(field.name)
+            if convert is not None:
+                values = _map_unique(values, convert)
+            arrays.append(pa.array(values, type=field.type))
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def clear(self) -> None:
+        for values in self.data.values():
+            values.clear()
+
+
+class ArrowSink:
+    """Typed Parquet or Arrow IPC files, one per table, written in batches.
+
+    Dates are always written as date32, converted column-wise at flush, so
+    the row-level date formatting in run() is skipped for this sink.
+
+    Rows are buffered ``batch_size`` at a time and appended as record
+    batches / row groups. With ``partition_by_month`` the events table is
+    written as a hive-style directory, <stem>.events/start_month=YYYY-MM/.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        file_format: str = "parquet",
+        partition_by_month: bool = False,
+        batch_size: int = 10_000,
+    ):
+        if pa is None:
+            raise RuntimeError(f"--format {file_format} requires pyarrow")
+        self.stem = os.path.splitext(path)[0]
+        self.file_format = file_format
+        self.partition_by_month = partition_by_month
+        self.batch_size = batch_size
+        self.tables = _arrow_tables()
+        self.native_dates = True
+        self._buffers: Dict[Tuple[str, Optional[str]], ColumnBuffer] = {}
+        self._writers: Dict[Tuple[str, Optional[str]], Any] = {}
+
+    def _partition(self, table: str, start_date: Any) -> Optional[str]:
+        if not self.partition_by_month or table != "events":
+            return None
+        start = _to_date(start_date)
+        return start.strftime("%Y-%m") if start else "__HIVE_DEFAULT_PARTITION__"
+
+    def _path(self, table: str, partition: Optional[str]) -> str:
+        ext = "parquet" if self.file_format == "parquet" else "arrow"
+        if partition is None:
+            return f"{self.stem}.{table}.{ext}"
+        directory = os.path.join(f"{self.stem}.{table}", f"start_month={partition}")
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f"part-0.{ext}")
+
+    def _buffer(self, key: Tuple[str, Optional[str]]) -> ColumnBuffer:
+        buf = self._buffers.get(key)
+        if buf is None:
+            buf = self._buffers[key] = ColumnBuffer(TABLE_COLUMNS[key[0]])
+        return buf
+
+    def write(self, table: str, row: Dict[str, Any]) -> None:
+        key = (table, self._partition(table, row.get("start_date")))
+        buf = self._buffer(key)
+        buf.append(row)
+        if len(buf) >= self.batch_size:
+            self._flush(key)
+
+    def write_record(self, table: str, rec: Any) -> None:
+        """Buffer an EventRecord/DivisionRecord without converting it to a row."""
+        key = (table, self._partition(table, getattr(rec, "start_date", None)))
+        buf = self._buffer(key)
+        buf.append_record(rec)
+        if len(buf) >= self.batch_size:
+            self._flush(key)
+
+    def _flush(self, key: Tuple[str, Optional[str]]) -> None:
+        buf = self._buffers.get(key)
+        if not buf:
+            return
+        schema, converters = self.tables[key[0]]
+        batch = buf.to_arrow(schema, converters)
+        buf.clear()
+
+        writer = self._writers.get(key)
+        if writer is None:
+            path = self._path(*key)
+            if self.file_format == "parquet":
+                writer = pq.ParquetWriter(path, schema)
+            else:
+                writer = pa.ipc.new_file(path, schema)
+            self._writers[key] = writer
+        writer.write_batch(batch)
+
+    def close(self) -> None:
+        for key in list(self._buffers):
+            self._flush(key)
+        for writer in self._writers.values():
+            writer.close()
+
+
+class DatabaseSink:
+    """Bulk upserts into SQLite (``target`` is a file path) or Postgres (a DSN).
+
+    Rows are buffered per table and flushed ``batch_size`` at a time with
+    executemany in one transaction. events and divisions are upserted on
+    event_id / event_division_assignment_id, so reruns update rows in
+    place; error tables are append-only.
+
+    Event dates skip run()'s display formatting: Postgres stores them as
+    DATE, SQLite as ISO-8601 text, so both sort and compare correctly.
+    """
+
+    KEYS = {"events": "event_id", "divisions": "event_division_assignment_id"}
+    COLUMN_TYPES = {
+        "event_id": "BIGINT",
+        "event_division_assignment_id": "BIGINT",
+        "maximum_teams": "INTEGER",
+        "entry_fee": "NUMERIC(12, 2)",
+        "start_date": "DATE",
+        "end_date": "DATE",
+    }
+    CONVERTERS = {
+        "event_id": _to_int,
+        "event_division_assignment_id": _to_int,
+        "maximum_teams": _to_int,
+        "entry_fee": _to_decimal,
+        "start_date": _to_date,
+        "end_date": _to_date,
+    }
+
+    def __init__(self, target: str, dialect: str = "sqlite", batch_size: int = 1000):
+        self.dialect = dialect
+        self.batch_size = batch_size
+        if dialect == "postgres":
+            if psycopg is None:
+                raise RuntimeError("--format postgres requires psycopg")
+            self.conn = psycopg.connect(target)
+            self.placeholder = "%s"
+        else:
+            self.conn = sqlite3.connect(target)
+            self.placeholder = "?"
+        self.native_dates = True
+        self._buffers: Dict[str, List[tuple]] = {t: [] for t in TABLE_COLUMNS}
+        self.skipped = 0
+        self._create_tables()
+
+    def _create_tables(self) -> None:
+        cur = self.conn.cursor()
+        for table, columns in TABLE_COLUMNS.items():
+            defs = []
+            for c in columns:
+                col = f'"{c}" {self.COLUMN_TYPES.get(c, "TEXT")}'
+                if self.KEYS.get(table) == c:
+                    col += " PRIMARY KEY"
+                defs.append(col)
+            cur.execute(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(defs)})")
+        self.conn.commit()
+
+    def _statement(self, table: str) -> str:
+        columns = TABLE_COLUMNS[table]
+        quoted = ", ".join(f'"{c}"' for c in columns)
+        sql = (
+            f"INSERT INTO {table} ({quoted}) "
+            f"VALUES ({', '.join([self.placeholder] * len(columns))})"
+        )
+        key = self.KEYS.get(table)
+        if key is not None:
+            updates = ", ".join(f'"{c}" = excluded."{c}"' for c in columns if c != key)
+            sql += f' ON CONFLICT ("{key}") DO UPDATE SET {updates}'
+        return sql
+
+    def write(self, table: str, row: Dict[str, Any]) -> None:
+        values = []
+        for c in TABLE_COLUMNS[table]:
+            value = row.get(c)
+            convert = self.CONVERTERS.get(c)
+            if convert is not None:
+                value = convert(value)
+                # sqlite3 has no Decimal adapter (NUMERIC affinity parses
+                # text) and its date adapter is deprecated.
+                if self.dialect == "sqlite":
+                    if isinstance(value, Decimal):
+                        value = str(value)
+                    elif isinstance(value, date):
+                        value = value.isoformat()
+            elif isinstance(value, date):
+                value = value.isoformat()
+            values.append(value)
+        key = self.KEYS.get(table)
+        if key is not None and values[TABLE_COLUMNS[table].index(key)] is None:
+            self.skipped += 1  # nothing to upsert on
+            return
+        buf = self._buffers[table]
+        buf.append(tuple(values))
+        if len(buf) >= self.batch_size:
+            self._flush(table)
+
+    def _flush(self, table: str) -> None:
+        rows = self._buffers[table]
+        if not rows:
+            return
+        cur = self.conn.cursor()
+        cur.executemany(self._statement(table), rows)
+        self.conn.commit()
+        self._buffers[table] = []
+
+    def close(self) -> None:
+        for table in self._buffers:
+            self._flush(table)
+        self.conn.close()
+        if self.skipped:
+            print(f"Database: skipped {self.skipped} rows without a key")
+
+
+SINKS = {
+    "xlsx": XlsxSink,
+    "csv": CsvSink,
+    "jsonl": JsonLinesSink,
+    "parquet": partial(ArrowSink, file_format="parquet"),
+    "arrow": partial(ArrowSink, file_format="arrow"),
+    "sqlite": DatabaseSink,
+    "postgres": partial(DatabaseSink, dialect="postgres"),
+}
+
+
+def default_cache_ttls(is_past_events: bool) -> List[Tuple[str, float]]:
+    """Details and divisions of past events are effectively immutable."""
+    detail_ttl = 3 * 24 * 3600 if is_past_events else 3600
+    return [
+        (r"/api/landing/events\?", 600),
+        (r"/api/landing/events/(scheduler/)?\d+(/divisions)?$", detail_ttl),
+    ]
+
+
+def _cache_ttl_rule(value: str) -> Tuple[str, float]:
+    """Parse a --cache-ttl REGEX=SECONDS rule."""
+    pattern, sep, seconds = value.rpartition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected REGEX=SECONDS, got {value!r}")
+    try:
+        re.compile(pattern)
+        return pattern, float(seconds)
+    except re.error as e:
+        raise argparse.ArgumentTypeError(f"bad regex {pattern!r}: {e}")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"bad seconds {seconds!r} in {value!r}")
+
+
+@dataclass
+class EventFilter:
+    """Which listing events to scrape.
+
+    The start-date window is pushed into the OData $filter of the listing
+    request; every criterion is also checked client-side on the listing
+    rows before any detail or division request is made. Rows that lack a
+    field being filtered on do not match.
+    """
+
+    start_from: Optional[date] = None
+    start_to: Optional[date] = None
+    states: FrozenSet[str] = frozenset()
+    event_type: Optional[Pattern] = None
+    name: Optional[Pattern] = None
+
+    def odata_clauses(self) -> List[str]:
+        clauses = []
+        if self.start_from is not None:
+            clauses.append(f"startDate+ge+{self.start_from.isoformat()}T00:00:00Z")
+        if self.start_to is not None:
+            end = self.start_to + timedelta(days=1)
+            clauses.append(f"startDate+lt+{end.isoformat()}T00:00:00Z")
+        return clauses
+
+    def matches(self, item: Dict[str, Any]) -> bool:
+        if self.start_from is not None or self.start_to is not None:
+            start = _to_date(item.get("startDate"))
+            if start is None:
+                return False
+            if self.start_from is not None and start < self.start_from:
+                return False
+            if self.start_to is not None and start > self.start_to:
+                return False
+        if self.states:
+            addr = item.get("address") or {}
+            abbr = ((addr.get("state") or {}).get("abbreviation")) or ""
+            if abbr.upper() not in self.states:
+                return False
+        if self.event_type is not None:
+            aff = (item.get("affiliation") or {}).get("description") or ""
+            et = (item.get("eventType") or {}).get("description") or ""
+            if not self.event_type.search(f"{aff} {et}".strip()):
+                return False
+        if self.name is not None and not self.name.search(item.get("name") or ""):
+            return False
+        return True
+
+
+def json_backends() -> Dict[str, Callable[[bytes], Any]]:
+    """Available JSON decoders by name, fastest first."""
+    backends: Dict[str, Callable[[bytes], Any]] = {}
+    if orjson is not None:
+        backends["orjson"] = orjson.loads
+    if msgspec is not None:
+        backends["msgspec"] = msgspec.json.Decoder().decode
+    backends["stdlib"] = json.loads
+    return backends
+
+
+_NUMBER_CHARS = re.compile(r"[-+0-9.eE]*")
+
+
+def iter_json_array(
+    chunks: Iterable[bytes], key: str, meta: Dict[str, Any]
+) -> Iterator[Any]:
+    """Yield the items of the top-level array ``key`` of a streamed JSON object.
+
+    Only one item is decoded at a time, so the document is never held in
+    memory as a whole. The object's other top-level members are decoded
+    into ``meta`` as they pass (e.g. @odata.count).
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+            buf += text.decode(b"", final=True)
+        else:
+            buf = buf[pos:] + text.decode(chunk)
+            pos = 0
+        return True
+
+    def skip_ws() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not fill():
+                raise ValueError("unexpected end of JSON stream")
+
+    def expect(chars: str) -> str:
+        nonlocal pos
+        c = skip_ws()
+        if c not in chars:
+            raise ValueError(f"expected one of {chars!r} at {c!r}")
+        pos += 1
+        return c
+
+    def value() -> Any:
+        nonlocal pos
+        if skip_ws() in "-0123456789":
+            # A number running to the end of the buffer may continue in the
+            # next chunk ("1e" + "5"); it is complete once something follows.
+            while _NUMBER_CHARS.match(buf, pos).end() == len(buf) and fill():
+                pass
+        while True:
+            try:
+                obj, pos = decoder.raw_decode(buf, pos)
+                return obj
+            except json.JSONDecodeError:
+                if fill():
+                    continue
+                raise
+
+    expect("{")
+    if skip_ws() == "}":
+        return
+    while True:
+        name = value()
+        expect(":")
+        if name == key and skip_ws() == "[":
+            pos += 1
+            if skip_ws() == "]":
+                pos += 1
+            else:
+                while True:
+                    yield value()
+                    if expect(",]") == "]":
+                        break
+        else:
+            meta[name] = value()
+        if expect(",}") == "}":
+            return
+
+
+def _event_key(item: Dict[str, Any]) -> str:
+    """Stable identity for a listing row; scheduler-only events have no eventId."""
+    if item.get("eventId") is not None:
+        return str(item["eventId"])
+    return f"scheduler:{item.get('eventSchedulerId')}"
+
+
+def _fingerprint(item: Dict[str, Any]) -> str:
+    return hashlib.sha1(
+        json.dumps(item, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+class StateStore:
+    """SQLite snapshot of listing rows and the records scraped for them.
+
+    Used by incremental runs: an event whose listing row is unchanged since
+    the last run is served from here instead of being refetched.
+    """
+
+    def __init__(self, path: str, commit_every: int = 200):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS events (
+                event_key TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                event TEXT NOT NULL,
+                divisions TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+            """)
+        self.commit_every = commit_every
+        self._uncommitted = 0
+
+    def lookup(
+        self, key: str, fingerprint: str
+    ) -> Optional[Tuple[EventRecord, List[DivisionRecord]]]:
+        row = self.conn.execute(
+            "SELECT fingerprint, event, divisions FROM events WHERE event_key = ?",
+            (key,),
+        ).fetchone()
+        if row is None or row[0] != fingerprint:
+            return None
+        event = EventRecord.from_row(json.loads(row[1]))
+        divisions = [DivisionRecord.from_row(d) for d in json.loads(row[2])]
+        return event, divisions
+
+    def save(
+        self,
+        key: str,
+        fingerprint: str,
+        event: EventRecord,
+        divisions: List[DivisionRecord],
+    ) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?)",
+            (
+                key,
+                fingerprint,
+                json.dumps(event_row(event)),
+                json.dumps([division_row(d) for d in divisions], default=str),
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_every:
+            self.conn.commit()
+            self._uncommitted = 0
+
+    def close(self) -> None:
+        self.conn.commit()
+        self.conn.close()
+
+
+class Journal:
+    """Append-only JSON Lines log of finished fetches, used by --resume.
+
+    Each detail, division list and error is written (and flushed) as soon
+    as it completes. On resume, events whose detail and divisions were both
+    journaled are restored and skipped; anything else is fetched again.
+    """
+
+    def __init__(self, path: str, resume: bool = False):
+        self.path = path
+        self.completed: Dict[str, Tuple[EventRecord, List[DivisionRecord]]] = {}
+        if resume and os.path.exists(path):
+            end = self._load()
+            if os.path.getsize(path) > end:
+                # Drop the torn tail so appended entries start on a fresh line.
+                os.truncate(path, end)
+        self._file = open(path, "a" if resume else "w", encoding="utf-8")
+
+    def _load(self) -> int:
+        """Restore completed events; returns the offset past the last whole line."""
+        halves: Dict[str, Dict[str, Any]] = {}
+        end = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # torn final line from the interrupted run
+                end += len(line)
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # damaged line; its event is simply fetched again
+                if entry["kind"] == "event":
+                    halves.setdefault(entry["key"], {})["event"] = EventRecord.from_row(
+                        entry["result"]
+                    )
+                elif entry["kind"] == "division":
+                    halves.setdefault(entry["key"], {})["division"] = [
+                        DivisionRecord.from_row(d) for d in entry["result"]
+                    ]
+        self.completed = {
+            key: (got["event"], got["division"])
+            for key, got in halves.items()
+            if len(got) == 2
+        }
+        return end
+
+    def write(self, kind: str, key: str, result: Any) -> None:
+        if kind == "division":
+            result = [division_row(r) for r in result]
+        elif kind == "event":
+            result = event_row(result)
+        entry = {"kind": kind, "key": key, "result": result}
+        self._file.write(json.dumps(entry, default=str))
+        self._file.write("\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+# Upper bounds (seconds) of the histogram buckets; the sub-millisecond
+# ones are for parse time.
+LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+_MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class Histogram:
+    """Bucketed latency distribution; quantiles are bucket upper bounds."""
+
+    __slots__ = ("count", "sum", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if value <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def quantile(self, q: float) -> float:
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank and n:
+                return LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else self.max
+        return self.max
+
+
+class Metrics:
+    """Thread-safe counters and histograms for one run, keyed by name and labels.
+
+    Request latency, bytes and retries are labelled by endpoint (listing,
+    event, scheduler, divisions); parse time by record kind. A metrics sink
+    renders the collected values once the run is over.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters: Dict[_MetricKey, float] = {}
+        self.histograms: Dict[_MetricKey, Histogram] = {}
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            hist = self.histograms.get(key)
+            if hist is None:
+                hist = self.histograms[key] = Histogram()
+            hist.observe(seconds)
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        with self.lock:
+            return {
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in sorted(self.counters.items())
+                ],
+                "histograms": [
+                    {
+                        "name": name,
+                        "labels": dict(labels),
+                        "count": h.count,
+                        "sum": h.sum,
+                        "max": h.max,
+                        "p50": h.quantile(0.5),
+                        "p95": h.quantile(0.95),
+                        "p99": h.quantile(0.99),
+                        "buckets": dict(
+                            zip([*map(str, LATENCY_BUCKETS), "+Inf"], h.buckets)
+                        ),
+                    }
+                    for (name, labels), h in sorted(self.histograms.items())
+                ],
+            }
+
+
+def _endpoint(url: str) -> str:
+    path = url.split("?", 1)[0]
+    if path.endswith("/divisions"):
+        return "divisions"
+    if "/scheduler/" in path:
+        return "scheduler"
+    if path.endswith("/events"):
+        return "listing"
+    return "event"
+
+
+def _label_text(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f"{k}={v}" for k, v in labels.items()) + "}"
+
+
+class LogMetricsSink:
+    """Prints a per-stage summary to stdout."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+
+    def emit(self, metrics: Metrics) -> None:
+        snap = metrics.snapshot()
+        print("Metrics:")
+        for h in snap["histograms"]:
+            print(
+                f"  {h['name']}{_label_text(h['labels'])}: n={h['count']} "
+                f"total={h['sum']:.3f}s mean={h['sum'] / h['count'] * 1000:.2f}ms "
+                f"p95<={h['p95'] * 1000:.0f}ms max={h['max'] * 1000:.1f}ms"
+            )
+        for c in snap["counters"]:
+            value = c["value"]
+            shown = f"{value:.3f}" if isinstance(value, float) else f"{value:,}"
+            print(f"  {c['name']}{_label_text(c['labels'])}: {shown}")
+
+
+class JsonMetricsSink:
+    """Writes the metrics snapshot to ``<stem>.metrics.json``."""
+
+    def __init__(self, path: str):
+        self.path = f"{path}.metrics.json"
+
+    def emit(self, metrics: Metrics) -> None:
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(metrics.snapshot(), f, indent=2)
+        print(f"Metrics written to {self.path}")
+
+
+def _prom_escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class PrometheusMetricsSink:
+    """Writes ``<stem>.prom`` in Prometheus text format (node_exporter textfile collector)."""
+
+    prefix = "aes_scraper_"
+
+    def __init__(self, path: str):
+        self.path = f"{path}.prom"
+
+    @staticmethod
+    def _labels(labels: Dict[str, str], **extra: str) -> str:
+        merged = {**labels, **extra}
+        if not merged:
+            return ""
+        body = ",".join(f'{k}="{_prom_escape(v)}"' for k, v in merged.items())
+        return "{" + body + "}"
+
+    def emit(self, metrics: Metrics) -> None:
+        snap = metrics.snapshot()
+        lines: List[str] = []
+        typed = set()
+        for c in snap["counters"]:
+            name = f"{self.prefix}{c['name']}"
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name}{self._labels(c['labels'])} {c['value']}")
+        for h in snap["histograms"]:
+            name = f"{self.prefix}{h['name']}"
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} histogram")
+            cumulative = 0
+            for le, n in h["buckets"].items():
+                cumulative += n
+                lines.append(
+                    f"{name}_bucket{self._labels(h['labels'], le=le)} {cumulative}"
+                )
+            lines.append(f"{name}_sum{self._labels(h['labels'])} {h['sum']}")
+            lines.append(f"{name}_count{self._labels(h['labels'])} {h['count']}")
+        # Write then rename so a scraper never reads a half-written file.
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp, self.path)
+        print(f"Metrics written to {self.path}")
+
+
+METRICS_SINKS = {
+    "log": LogMetricsSink,
+    "json": JsonMetricsSink,
+    "prometheus": PrometheusMetricsSink,
+}
+
+
+def _format_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+class ProgressReporter:
+    """Completed/total, rate, errors and ETA per stage, reported at most every ``interval`` seconds.
+
+    Updates only bump counters; a report is produced by whichever update
+    first finds the interval elapsed. Each report is printed and, with
+    ``stream_path``, appended there as one JSON object per line.
+
+    Until the listing is exhausted the detail/division totals are
+    estimated from @odata.count and the share of listed events that made
+    it past dedup, filters and resume so far.
+    """
+
+    STAGES = ("listing", "details", "divisions")
+
+    def __init__(
+        self,
+        interval: float = 5.0,
+        stream_path: Optional[str] = None,
+        extra: Optional[Callable[[], Dict[str, Any]]] = None,
+    ):
+        self.interval = interval
+        self.extra = extra
+        self.lock = threading.Lock()
+        self.started = self.last = time.monotonic()
+        # "last" is when the stage last completed an item; a finished
+        # stage's rate is its average over started..last, in every report.
+        self.stages = {
+            name: {"done": 0, "errors": 0, "rate": 0.0, "reported": 0, "last": 0.0}
+            for name in self.STAGES
+        }
+        self.listing_total: Optional[int] = None
+        self.listing_finished = False
+        self.submitted = 0
+        self._stream = open(stream_path, "a", encoding="utf-8") if stream_path else None
+
+    def listed(self, total: Optional[int]) -> None:
+        with self.lock:
+            self.listing_total = total
+            got = self.stages["listing"]
+            got["done"] += 1
+            got["last"] = time.monotonic()
+            self._tick(got["last"])
+
+    def finish_listing(self) -> None:
+        with self.lock:
+            self.listing_finished = True
+
+    def submit(self) -> None:
+        with self.lock:
+            self.submitted += 1
+
+    def done(self, stage: str, failed: bool = False) -> None:
+        with self.lock:
+            got = self.stages[stage]
+            got["done"] += 1
+            got["last"] = time.monotonic()
+            if failed:
+                got["errors"] += 1
+            self._tick(got["last"])
+
+    def _tick(self, now: float) -> None:
+        if now - self.last >= self.interval:
+            self._report(now)
+
+    def _totals(self) -> Dict[str, Optional[int]]:
+        listed = self.stages["listing"]["done"]
+        if self.listing_finished:
+            fetch_total = self.submitted
+        elif self.listing_total is not None and listed:
+            fetch_total = round(self.listing_total * self.submitted / listed)
+        else:
+            fetch_total = None
+        return {
+            "listing": listed if self.listing_finished else self.listing_total,
+            "details": fetch_total,
+            "divisions": fetch_total,
+        }
+
+    def _snapshot(self, now: float, final: bool) -> Dict[str, Any]:
+        window = now - self.last
+        totals = self._totals()
+        stages = {}
+        for name, got in self.stages.items():
+            total = totals[name]
+            finished = total is not None and got["done"] >= total
+            if final or (finished and got["done"] > got["reported"]):
+                # Finished stages (and every stage in the final report) give
+                # their average rate up to their last completion, so a stage
+                # that ended early is not diluted by the rest of the run.
+                got["rate"] = got["done"] / max(got["last"] - self.started, 1e-9)
+            elif not finished and window > 0:
+                current = (got["done"] - got["reported"]) / window
+                # Smooth the per-window rate so one slow window doesn't swing the ETA.
+                got["rate"] = (
+                    current
+                    if not got["reported"]
+                    else 0.5 * got["rate"] + 0.5 * current
+                )
+            got["reported"] = got["done"]
+            remaining = None if total is None else max(0, total - got["done"])
+            stages[name] = {
+                "done": got["done"],
+                "total": total,
+                "errors": got["errors"],
+                "rate": round(got["rate"], 2),
+                "eta_seconds": (
+                    round(remaining / got["rate"], 1)
+                    if remaining is not None and got["rate"] > 0
+                    else None
+                ),
+            }
+        snap = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "elapsed": round(now - self.started, 2),
+            "final": final,
+            "stages": stages,
+        }
+        if self.extra is not None:
+            snap.update(self.extra())
+        return snap
+
+    def _report(self, now: float, final: bool = False) -> None:
+        snap = self._snapshot(now, final)
+        self.last = now
+        if self._stream is not None:
+            self._stream.write(json.dumps(snap))
+            self._stream.write("\n")
+            self._stream.flush()
+        if final:
+            return
+        parts = []
+        for name, s in snap["stages"].items():
+            total = "?" if s["total"] is None else f"{s['total']:,}"
+            part = f"{name} {s['done']:,}/{total} {s['rate']:,.1f}/s"
+            if s["eta_seconds"] is not None and s["done"] < (s["total"] or 0):
+                part += f" ETA {_format_duration(s['eta_seconds'])}"
+            if s["errors"]:
+                part += f", {s['errors']} errors"
+            parts.append(part)
+        extra = "".join(
+            f" | {k.replace('_', ' ')} {v}"
+            for k, v in snap.items()
+            if k not in ("time", "elapsed", "final", "stages")
+        )
+        print(
+            f"Progress [{_format_duration(snap['elapsed'])}]: "
+            + " | ".join(parts)
+            + extra
+        )
+
+    def close(self) -> None:
+        with self.lock:
+            if self._stream is not None:
+                self._report(time.monotonic(), final=True)
+                self._stream.close()
+                self._stream = None
+
+
+class FileCacheBackend:
+    """One file per cached response: a JSON header line followed by the body."""
+
+    def __init__(self, directory: str, max_bytes: int = 0):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(e.stat().st_size for e in os.scandir(directory) if e.is_file())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest())
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                meta = json.loads(f.readline())
+                body = f.read()
+            os.utime(path)  # mtime doubles as last-access time for eviction
+        except (OSError, ValueError):
+            return None
+        meta["body"] = body
+        return meta
+
+    def set(self, key: str, entry: Dict[str, Any]) -> None:
+        meta = {k: v for k, v in entry.items() if k != "body"}
+        data = json.dumps(meta).encode() + b"\n" + entry["body"]
+        path = self._path(key)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        with self._lock:
+            try:
+                self._size -= os.path.getsize(path)
+            except OSError:
+                pass
+            os.replace(tmp, path)
+            self._size += len(data)
+            if self.max_bytes and self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        files = sorted(
+            (e for e in os.scandir(self.directory) if e.is_file()),
+            key=lambda e: e.stat().st_mtime,
+        )
+        target = self.max_bytes * 0.9
+        for e in files:
+            if self._size <= target:
+                break
+            try:
+                size = e.stat().st_size
+                os.remove(e.path)
+            except OSError:
+                continue
+            self._size -= size
+
+
+class SQLiteCacheBackend:
+    """All cached responses in one SQLite file."""
+
+    def __init__(self, path: str, max_bytes: int = 0):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                meta TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                accessed REAL NOT NULL
+            )
+            """)
+        self.conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT meta, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+            self.conn.commit()
+        meta = json.loads(row[0])
+        meta["body"] = bytes(row[1])
+        return meta
+
+    def set(self, key: str, entry: Dict[str, Any]) -> None:
+        meta = json.dumps({k: v for k, v in entry.items() if k != "body"})
+        body = entry["body"]
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, meta, body, len(meta) + len(body), time.time()),
+            )
+            if self.max_bytes:
+                (total,) = self.conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM responses"
+                ).fetchone()
+                if total > self.max_bytes:
+                    self._evict(total)
+            self.conn.commit()
+
+    def _evict(self, total: int) -> None:
+        target = self.max_bytes * 0.9
+        rows = self.conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed"
+        ).fetchall()
+        for key, size in rows:
+            if total <= target:
+                break
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+
+class ResponseCache:
+    """Response cache with per-URL-pattern TTLs.
+
+    ``ttls`` is a list of ``(regex, seconds)``; the first pattern that matches
+    a URL decides its TTL, and URLs matching none are not cached.
+    """
+
+    def __init__(self, backend, ttls: List[Tuple[str, float]]):
+        self.backend = backend
+        self.ttls = [(re.compile(pattern), float(ttl)) for pattern, ttl in ttls]
+
+    def ttl_for(self, url: str) -> float:
+        for pattern, ttl in self.ttls:
+            if pattern.search(url):
+                return ttl
+        return 0.0
+
+
+class TokenBucket:
+    """Token-bucket rate limiter shared by every worker thread and coroutine.
+
+    Callers reserve a token up front and sleep off any deficit, so waiters
+    are released at ``rate`` per second in arrival order with no polling.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on the number of in-flight requests.
+
+    Every completed request grows the limit by 1/limit (about +1 per round
+    trip of the whole window). A 429/503, a connection failure, or a window
+    p95 latency above ``latency_factor`` times the best p95 seen so far
+    halves it, at most once per ``cooldown`` seconds.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: int = 128,
+        window: int = 100,
+        latency_factor: float = 2.0,
+        backoff: float = 0.5,
+        cooldown: float = 1.0,
+    ):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.latency_factor = latency_factor
+        self.backoff = backoff
+        self.cooldown = cooldown
+        self.inflight = 0
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._baseline_p95: Optional[float] = None
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+        self._async_waiters: Deque[asyncio.Future] = deque()
+
+    def _try_acquire(self) -> bool:
+        if self.inflight < int(self.limit):
+            self.inflight += 1
+            return True
+        return False
+
+    def acquire(self) -> None:
+        with self._cond:
+            while not self._try_acquire():
+                self._cond.wait()
+
+    async def acquire_async(self) -> None:
+        while True:
+            with self._cond:
+                if self._try_acquire():
+                    return
+                fut = asyncio.get_running_loop().create_future()
+                self._async_waiters.append(fut)
+            await fut
+
+    def release(self, latency: float, statuses: Iterable[int] = (), failed=False):
+        with self._cond:
+            self.inflight -= 1
+            self._observe(latency, failed or any(s in (429, 503) for s in statuses))
+            free = max(0, int(self.limit) - self.inflight)
+            self._cond.notify(free)
+            woken = [
+                self._async_waiters.popleft()
+                for _ in range(min(free, len(self._async_waiters)))
+            ]
+        for fut in woken:
+            fut.get_loop().call_soon_threadsafe(_resolve, fut)
+
+    def _observe(self, latency: float, throttled: bool) -> None:
+        self._latencies.append(latency)
+        if throttled or self._latency_degraded():
+            now = time.monotonic()
+            if now - self._last_decrease >= self.cooldown:
+                self.limit = max(self.minimum, self.limit * self.backoff)
+                self._last_decrease = now
+                self._latencies.clear()
+        else:
+            self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+
+    def _latency_degraded(self) -> bool:
+        if len(self._latencies) < self._latencies.maxlen:
+            return False
+        window = sorted(self._latencies)
+        p95 = window[int(len(window) * 0.95) - 1]
+        if self._baseline_p95 is None or p95 < self._baseline_p95:
+            self._baseline_p95 = p95
+        return p95 > self._baseline_p95 * self.latency_factor
+
+
+def _resolve(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+
+_HOP_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+def _stored_headers(headers) -> Dict[str, str]:
+    """Response headers worth persisting; the stored body is already decoded."""
+    return {k: v for k, v in headers.items() if k.lower() not in _HOP_HEADERS}
+
+
+def _response_from_entry(request, entry: Dict[str, Any], adapter) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = entry["status"]
+    resp.reason = "OK"
+    resp.headers = CaseInsensitiveDict(entry["headers"])
+    resp.encoding = get_encoding_from_headers(resp.headers)
+    resp._content = entry["body"]
+    resp._content_consumed = True
+    resp.url = request.url
+    resp.request = request
+    resp.connection = adapter
+    return resp
+
+
+class FixtureStore:
+    """Recorded HTTP responses on disk, keyed by URL.
+
+    In "record" mode every successful response is saved as <sha1>.json
+    (the body) plus <sha1>.meta (URL, status, headers). In "replay" mode
+    responses are served from those files instead of the network, after an
+    optional synthetic latency of ``latency`` plus up to ``jitter`` seconds.
+    """
+
+    def __init__(
+        self, directory: str, mode: str, latency: float = 0.0, jitter: float = 0.0
+    ):
+        self.directory = directory
+        self.replay = mode == "replay"
+        self.latency = latency
+        self.jitter = jitter
+        os.makedirs(directory, exist_ok=True)
+
+    def _base(self, url: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(url.encode()).hexdigest())
+
+    def delay(self) -> float:
+        return self.latency + random.uniform(0, self.jitter)
+
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        base = self._base(url)
+        try:
+            with open(f"{base}.meta", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(f"{base}.json", "rb") as f:
+                meta["body"] = f.read()
+        except OSError:
+            return None
+        return meta
+
+    def save(self, url: str, status: int, headers, body: bytes) -> None:
+        base = self._base(url)
+        suffix = f".{threading.get_ident()}.tmp"
+        with open(base + ".json" + suffix, "wb") as f:
+            f.write(body)
+        os.replace(base + ".json" + suffix, base + ".json")
+        meta = {"url": url, "status": status, "headers": _stored_headers(headers)}
+        with open(base + ".meta" + suffix, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(base + ".meta" + suffix, base + ".meta")
+
+
+class _StoredResponse:
+    """The parts of an aiohttp response the async engine reads, from a stored entry."""
+
+    def __init__(self, url: str, entry: Dict[str, Any]):
+        self.url = url
+        self.status = entry["status"]
+        self.headers = CaseInsensitiveDict(entry["headers"])
+        self.ok = self.status < 400
+        self._body = entry["body"]
+
+    async def read(self) -> bytes:
+        return self._body
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise ConnectionError(f"stored response for {self.url} is {self.status}")
+
+
+class _ReplayRequest:
+    def __init__(self, fixtures: FixtureStore, url: str):
+        self.fixtures = fixtures
+        self.url = url
+
+    async def __aenter__(self) -> _StoredResponse:
+        await asyncio.sleep(self.fixtures.delay())
+        entry = self.fixtures.load(self.url)
+        if entry is None:
+            raise ConnectionError(f"no recorded response for {self.url}")
+        return _StoredResponse(self.url, entry)
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+
+class ReplayClient:
+    """Stands in for the aiohttp session when replaying a FixtureStore.
+
+    The async counterpart of ThrottledAdapter's replay: requests still go
+    through the limiters, retries and metrics in _get_body_async, and only
+    the network call is swapped for a read from disk.
+    """
+
+    def __init__(self, fixtures: FixtureStore):
+        self.fixtures = fixtures
 
+    def get(self, url: str, **kwargs) -> _ReplayRequest:
+        return _ReplayRequest(self.fixtures, url)
 
-@dataclass
-class EventRecord:
-    event_id: Optional[str] = None
-    event_url: Optional[str] = None
-    name: Optional[str] = None
-    tournament_type: Optional[str] = None
-    host: Optional[str] = None
-    location: Optional[str] = None
-    address: Optional[str] = None
-    website: Optional[str] = None
-    email: Optional[str] = None
-    start_date: Optional[str] = None
-    end_date: Optional[str] = None
 
+class ThrottledAdapter(HTTPAdapter):
+    """HTTPAdapter that paces requests through the shared limiters.
 
-@dataclass
-class DivisionRecord:
-    description: Optional[str] = None
-    entry_fee: Optional[str] = None
-    event_division_assignment_id: Optional[str] = None
-    event_id: Optional[str] = None
-    maximum_teams: Optional[str] = None
+    Takes a token from the TokenBucket per request and, when adaptive
+    concurrency is on, holds an AdaptiveConcurrency slot for the duration
+    of the request (including urllib3 retries, whose statuses it reports).
+    Responses carry ``sent_at``, the perf_counter() time the request left
+    the limiters, so request latency excludes time spent waiting on them.
+    With a FixtureStore, responses are also recorded to or replayed from
+    disk here, underneath the limiters and any response cache.
+    """
 
+    def __init__(
+        self,
+        limiter: Optional[TokenBucket] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        fixtures: Optional[FixtureStore] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.limiter = limiter
+        self.concurrency = concurrency
+        self.fixtures = fixtures
 
-def _fmt_date(iso: Optional[str]) -> str:
-    if not iso:
-        return ""
-    try:
-        return datetime.fromisoformat(iso.replace("Z", "")).strftime("%m/%d/%Y")
-    except ValueError:
-        return ""
+    def _transport(self, request, **kwargs):
+        fixtures = self.fixtures
+        if fixtures is not None and fixtures.replay:
+            time.sleep(fixtures.delay())
+            entry = fixtures.load(request.url)
+            if entry is None:
+                raise requests.ConnectionError(
+                    f"no recorded response for {request.url}", request=request
+                )
+            return _response_from_entry(request, entry, self)
+        resp = super().send(request, **kwargs)
+        if fixtures is not None and resp.status_code < 400:
+            fixtures.save(request.url, resp.status_code, resp.headers, resp.content)
+        return resp
+
+    def send(self, request, **kwargs):
+        if self.limiter is not None:
+            self.limiter.acquire()
+        if self.concurrency is None:
+            started = time.perf_counter()
+            resp = self._transport(request, **kwargs)
+            resp.sent_at = started
+            return resp
+
+        self.concurrency.acquire()
+        started = time.perf_counter()
+        try:
+            resp = self._transport(request, **kwargs)
+        except Exception:
+            self.concurrency.release(time.perf_counter() - started, failed=True)
+            raise
+        history = getattr(getattr(resp.raw, "retries", None), "history", None) or ()
+        statuses = [h.status for h in history if h.status] + [resp.status_code]
+        self.concurrency.release(time.perf_counter() - started, statuses)
+        resp.sent_at = started
+        return resp
+
+
+class CachingAdapter(ThrottledAdapter):
+    """ThrottledAdapter that serves GETs from a ResponseCache.
+
+    Fresh entries are returned without touching the network. Stale entries
+    are revalidated with If-None-Match / If-Modified-Since when the server
+    supplied an ETag or Last-Modified, and a 304 refreshes the entry.
+    """
+
+    def __init__(self, cache: ResponseCache, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request, **kwargs):
+        ttl = self.cache.ttl_for(request.url) if request.method == "GET" else 0
+        if ttl <= 0:
+            return super().send(request, **kwargs)
+
+        entry = self.cache.backend.get(request.url)
+        if entry is not None and time.time() - entry["stored_at"] < ttl:
+            return self._from_entry(request, entry)
+
+        if entry is not None:
+            request = request.copy()
+            # Entries written by the async engine carry aiohttp's header case.
+            stored = CaseInsensitiveDict(entry["headers"])
+            if stored.get("ETag"):
+                request.headers["If-None-Match"] = stored["ETag"]
+            if stored.get("Last-Modified"):
+                request.headers["If-Modified-Since"] = stored["Last-Modified"]
+
+        resp = super().send(request, **kwargs)
+        if resp.status_code == 304 and entry is not None:
+            resp.close()
+            entry["stored_at"] = time.time()
+            self.cache.backend.set(request.url, entry)
+            return self._from_entry(request, entry)
+        if resp.status_code == 200:
+            self.cache.backend.set(
+                request.url,
+                {
+                    "status": resp.status_code,
+                    "headers": _stored_headers(resp.headers),
+                    "stored_at": time.time(),
+                    "body": resp.content,
+                },
+            )
+        return resp
+
+    def _from_entry(self, request, entry: Dict[str, Any]) -> requests.Response:
+        resp = _response_from_entry(request, entry, self)
+        resp.from_cache = True
+        return resp
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one.
+
+    While a call for a key is running, other callers with that key wait for
+    and share its result (or exception) instead of starting their own.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+        self._tasks: Dict[str, asyncio.Future] = {}
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            fut = self._calls.get(key)
+            leader = fut is None
+            if leader:
+                fut = self._calls[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return fut.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        else:
+            self.coalesced += 1
+        # Shielded so one cancelled waiter does not cancel the shared call.
+        return await asyncio.shield(task)
 
 
 class AESScraper:
@@ -57,59 +1971,124 @@ class AESScraper:
         delay_sec: float = 0.4,
         session: Optional[requests.Session] = None,
         is_past_events: bool = False,
+        cache: Optional[ResponseCache] = None,
+        rate: Optional[float] = None,
+        burst: int = 1,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        pool: str = "thread",
+        pool_size: Optional[int] = None,
+        fixtures: Optional[FixtureStore] = None,
+        base: str = BASE,
+        event_filter: Optional[EventFilter] = None,
+        json_backend: str = "auto",
+        decoder: str = "dict",
+        metrics: Optional[Metrics] = None,
     ):
         self._tls = threading.local()
+        self.metrics = metrics
         self.delay_sec = delay_sec
-        self.sess = session or self._build_session()
+        # --delay is the default pacing; an explicit rate overrides it.
+        if rate is None and delay_sec > 0:
+            rate = 1.0 / delay_sec
+        self.limiter = TokenBucket(rate, burst) if rate else None
+        self.concurrency = concurrency
+        self.fixtures = fixtures
+        # API root; point at mock_server.py for offline benchmarking.
+        self.base = base.rstrip("/")
         self.is_past_events = is_past_events
+        self.event_filter = event_filter
+        self.flight = SingleFlight()
+        backends = json_backends()
+        self.json_loads = (
+            next(iter(backends.values()))
+            if json_backend == "auto"
+            else backends[json_backend]
+        )
+        # "dict": decode to dicts and walk them in parse_*_api;
+        # "struct": decode straight into msgspec Structs.
+        if decoder == "struct" and msgspec is None:
+            raise RuntimeError("--decoder struct requires msgspec")
+        self.decoder = decoder
+        self.cache = cache
+        # "thread": one Session per thread; "shared": one Session for all
+        # threads. A caller-supplied session is always shared.
+        self.pool = "shared" if session is not None else pool
+        # Connections kept alive by the shared session; derived from the
+        # number of request threads in run() unless given.
+        self.pool_size = pool_size
+        self._sess = session
+        self._sess_lock = threading.Lock()
+
+    @property
+    def sess(self) -> requests.Session:
+        if self._sess is None:
+            with self._sess_lock:
+                if self._sess is None:
+                    self._sess = self._build_session(self.pool_size or 10)
+        return self._sess
 
     def _thread_session(self) -> requests.Session:
         """One Session per thread (requests.Session is not strictly thread-safe)."""
         if not hasattr(self._tls, "sess"):
-            self._tls.sess = self._build_session()
+            # A thread only ever has one request in flight.
+            self._tls.sess = self._build_session(1)
         return self._tls.sess
 
-    def _build_session(self) -> requests.Session:
+    def _session(self) -> requests.Session:
+        """The Session every request path goes through, per the pool strategy."""
+        return self._thread_session() if self.pool == "thread" else self.sess
+
+    def _build_session(self, pool_maxsize: int) -> requests.Session:
         sess = requests.Session()
         retries = Retry(
-            total=5,
-            backoff_factor=0.5,
-            status_forcelist=(429, 500, 502, 503, 504),
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF,
+            status_forcelist=tuple(sorted(RETRY_STATUSES)),
             allowed_methods=frozenset(["GET"]),
             raise_on_status=False,
         )
-        adapter = HTTPAdapter(
-            pool_connections=500, pool_maxsize=500, max_retries=retries
-        )
+        if self.cache is not None:
+            adapter = CachingAdapter(
+                self.cache,
+                limiter=self.limiter,
+                concurrency=self.concurrency,
+                fixtures=self.fixtures,
+                pool_connections=10,
+                pool_maxsize=pool_maxsize,
+                max_retries=retries,
+            )
+        else:
+            adapter = ThrottledAdapter(
+                limiter=self.limiter,
+                concurrency=self.concurrency,
+                fixtures=self.fixtures,
+                pool_connections=10,
+                pool_maxsize=pool_maxsize,
+                max_retries=retries,
+            )
         sess.mount("https://", adapter)
         sess.mount("http://", adapter)
         sess.headers.update(HEADERS)
         return sess
 
-    def _fetch_one_event(self, item: dict):
+    def _event_detail_url(self, item: dict) -> str:
         event_id = item["eventId"]
 
-        url = f"https://www.advancedeventsystems.com/api/landing/events/{event_id}"
+        url = f"{self.base}/api/landing/events/{event_id}"
 
         if event_id == None:
             event_scheduler_id = item["eventSchedulerId"]
-            url = f"https://www.advancedeventsystems.com/api/landing/events/scheduler/{event_scheduler_id}"
+            url = f"{self.base}/api/landing/events/scheduler/{event_scheduler_id}"
 
-        with self.sess.get(url, timeout=(5, 120)) as r:
-            r.raise_for_status()
-            data = r.json()
-            return self.parse_event_api(data)
+        return url
 
-    def _fetch_one_division(self, event: Dict[str, Any]) -> List[DivisionRecord]:
+    def _division_url(self, event: Dict[str, Any]) -> Optional[str]:
         event_id = event.get("eventId")
         if event_id is None:
-            return []
-
-        url = f"https://www.advancedeventsystems.com/api/landing/events/{int(event_id)}/divisions"
-        with self.sess.get(url, timeout=(5, 120)) as r:
-            r.raise_for_status()
-            payload = r.json()
+            return None
+        return f"{self.base}/api/landing/events/{int(event_id)}/divisions"
 
+    def _divisions_from_payload(self, payload: Any) -> List[DivisionRecord]:
         divisions = (
             payload["value"]
             if isinstance(payload, dict) and "value" in payload
@@ -118,152 +2097,1150 @@ class AESScraper:
 
         return [self.parse_division_api(d) for d in divisions]
 
-    def fetch_total_counts(self):
-        request = requests.get(
-            f"https://www.advancedeventsystems.com/api/landing/events?$count=true&$filter=isPastEvent+eq+{str(self.is_past_events).lower()}&$format=json&$orderby=startDate,name&$top=100"
-        )
+    def _record_request(
+        self, url: str, started: float, size: int = 0, retries: int = 0, failed=False
+    ) -> None:
+        """Per-endpoint latency, bytes, retries and failures, when metrics are on."""
+        endpoint = _endpoint(url)
+        m = self.metrics
+        m.observe("request_seconds", time.perf_counter() - started, endpoint=endpoint)
+        m.inc("requests_total", endpoint=endpoint)
+        if size:
+            m.inc("bytes_total", size, endpoint=endpoint)
+        if retries:
+            m.inc("retries_total", retries, endpoint=endpoint)
+        if failed:
+            m.inc("request_errors_total", endpoint=endpoint)
+
+    @staticmethod
+    def _retries(resp: requests.Response) -> int:
+        return len(getattr(getattr(resp.raw, "retries", None), "history", None) or ())
+
+    def _get_body(self, url: str) -> bytes:
+        started = time.perf_counter()
+        try:
+            with self._session().get(url, timeout=(5, 120)) as r:
+                # Time from leaving the limiters, not from queueing on them.
+                started = getattr(r, "sent_at", started)
+                r.raise_for_status()
+                body = r.content
+        except Exception:
+            if self.metrics is not None:
+                self._record_request(url, started, failed=True)
+            raise
+        if self.metrics is not None:
+            self._record_request(url, started, len(body), self._retries(r))
+        return body
+
+    def decode_event(self, body: bytes) -> EventRecord:
+        started = time.perf_counter()
+        if self.decoder == "struct":
+            rec = event_from_struct(_event_decoder.decode(body))
+        else:
+            rec = self.parse_event_api(self.json_loads(body))
+        if self.metrics is not None:
+            self.metrics.observe(
+                "parse_seconds", time.perf_counter() - started, kind="event"
+            )
+        return rec
+
+    def decode_divisions(self, body: bytes) -> List[DivisionRecord]:
+        started = time.perf_counter()
+        if self.decoder == "struct":
+            payload = _divisions_decoder.decode(body)
+            if isinstance(payload, _DivisionList):
+                payload = payload.value
+            recs = [division_from_struct(d) for d in payload or ()]
+        else:
+            recs = self._divisions_from_payload(self.json_loads(body))
+        if self.metrics is not None:
+            self.metrics.observe(
+                "parse_seconds", time.perf_counter() - started, kind="division"
+            )
+        return recs
+
+    def _fetch_one_event(self, item: dict):
+        url = self._event_detail_url(item)
+        return self.flight.do(url, lambda: self.decode_event(self._get_body(url)))
+
+    def _fetch_one_division(self, event: Dict[str, Any]) -> List[DivisionRecord]:
+        url = self._division_url(event)
+        if url is None:
+            return []
 
-        api_events = request.json()
-        return api_events["@odata.count"]
+        return self.flight.do(url, lambda: self.decode_divisions(self._get_body(url)))
 
-    def fetch_events(self, count):
-        url = f"https://www.advancedeventsystems.com/api/landing/events?$count=true&$filter=isPastEvent+eq+{str(self.is_past_events).lower()}&$format=json&$orderby=startDate,name&$top={count}"
-        request = requests.get(url)
-        api_events = request.json()
-        return api_events["value"]
+    def _odata_filter(self) -> str:
+        clauses = [f"isPastEvent+eq+{str(self.is_past_events).lower()}"]
+        if self.event_filter is not None:
+            clauses.extend(self.event_filter.odata_clauses())
+        return "+and+".join(clauses)
+
+    def _listing_url(self, skip: int, top: int) -> str:
+        return f"{self.base}/api/landing/events?$count=true&$filter={self._odata_filter()}&$format=json&$orderby=startDate,name&$skip={skip}&$top={top}"
+
+    def _fetch_listing_page(self, skip: int, top: int) -> Dict[str, Any]:
+        url = self._listing_url(skip, top)
+        started = time.perf_counter()
+        request = self._session().get(url, timeout=(5, 120))
+        if self.metrics is not None:
+            self._record_request(
+                url,
+                getattr(request, "sent_at", started),
+                len(request.content),
+                self._retries(request),
+                failed=not request.ok,
+            )
+        request.raise_for_status()
+        return self.json_loads(request.content)
+
+    def _stream_listing_page(
+        self, skip: int, top: int, meta: Dict[str, Any]
+    ) -> Iterator[dict]:
+        """Like _fetch_listing_page, but yields events while the body downloads."""
+        url = self._listing_url(skip, top)
+        started = time.perf_counter()
+        size = 0
+
+        def counted(chunks: Iterable[bytes]) -> Iterator[bytes]:
+            nonlocal size
+            for chunk in chunks:
+                size += len(chunk)
+                yield chunk
+
+        with self._session().get(url, timeout=(5, 120), stream=True) as request:
+            started = getattr(request, "sent_at", started)
+            if self.metrics is not None and not request.ok:
+                self._record_request(url, started, failed=True)
+            request.raise_for_status()
+            yield from iter_json_array(
+                counted(request.iter_content(65536)), "value", meta
+            )
+        if self.metrics is not None:
+            # Includes the time the consumer spent between streamed events.
+            self._record_request(url, started, size, self._retries(request))
+
+    def iter_events(
+        self,
+        page_size: int = 500,
+        workers: int = 4,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[dict]:
+        """Yield listing events in $orderby order, page by page.
+
+        The first page is parsed as it streams in and carries @odata.count,
+        so no separate count request is needed; the remaining pages are then
+        fetched concurrently by up to ``workers`` threads and yielded in
+        order as soon as each is ready.
+        @odata.count is stored into ``meta`` once the first page has it.
+        """
+        started = time.perf_counter()
+        try:
+            yield from self._iter_listing_pages(page_size, workers, meta)
+        finally:
+            if self.metrics is not None:
+                self.metrics.observe("listing_seconds", time.perf_counter() - started)
+
+    def _iter_listing_pages(
+        self, page_size: int, workers: int, meta: Optional[Dict[str, Any]]
+    ) -> Iterator[dict]:
+        first: Dict[str, Any] = meta if meta is not None else {}
+        fetched = 0
+        for event in self._stream_listing_page(0, page_size, first):
+            fetched += 1
+            yield event
+        total = first.get("@odata.count")
+        if total is None or not fetched:
+            return
+
+        # The server may cap $top below page_size; stride by what the first
+        # page actually held so no rows fall between pages.
+        step = min(page_size, fetched)
+        skips = range(fetched, total, step)
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
+            pages = ex.map(lambda skip: self._fetch_listing_page(skip, step), skips)
+            for skip, page in zip(skips, pages):
+                value = page.get("value") or []
+                if len(value) < step and skip + step < total:
+                    raise RuntimeError(
+                        f"listing page at $skip={skip} returned {len(value)} of "
+                        f"{step} events; later events would be missed"
+                    )
+                yield from value
 
     @staticmethod
     def _event_url_from_id(event_id: str) -> str:
         return f"{BASE}/events/{event_id}"
 
     def parse_event_api(self, data: Dict[str, Any]) -> EventRecord:
-        rec = EventRecord()
-        rec.event_id = str(data.get("eventId") or "")
-        rec.event_url = (
-            f"https://www.advancedeventsystems.com/events/{rec.event_id}"
-            if rec.event_id
-            else ""
-        )
-        rec.name = data.get("name") or ""
+        event_id = _to_int(data.get("eventId") or None)
 
         aff = (data.get("affiliation") or {}).get("description") or ""
         et = (data.get("eventType") or {}).get("description") or ""
-        rec.tournament_type = (f"{aff} {et}").strip() if (aff or et) else ""
-
-        rec.host = data.get("hostName") or data.get("bossOrganizationName") or ""
-        rec.location = data.get("locationName") or ""
 
         addr = data.get("address") or {}
         line1 = addr.get("line1") or ""
         city = addr.get("city") or ""
         state_abbr = ((addr.get("state") or {}).get("abbreviation")) or ""
         zip_code = addr.get("zip") or ""
-        rec.address = f"{line1}\n{city}, {state_abbr} {zip_code}".strip().rstrip(", ")
 
-        rec.website = data.get("website") or ""
-        rec.email = data.get("email") or ""
+        return EventRecord(
+            event_id=event_id,
+            event_url=(
+                f"https://www.advancedeventsystems.com/events/{event_id}"
+                if event_id
+                else ""
+            ),
+            name=data.get("name") or "",
+            tournament_type=_tournament_type(aff, et),
+            host=data.get("hostName") or data.get("bossOrganizationName") or "",
+            location=data.get("locationName") or "",
+            address=_format_address(line1, city, state_abbr, zip_code),
+            website=data.get("website") or "",
+            email=data.get("email") or "",
+            start_date=data.get("startDate") or None,
+            end_date=data.get("endDate") or None,
+        )
+
+    def parse_division_api(self, data: Dict[str, Any]) -> DivisionRecord:
+        return DivisionRecord(
+            description=str(data.get("description") or ""),
+            entry_fee=_to_decimal(data.get("entryFee") or 0),
+            event_division_assignment_id=_to_int(
+                data.get("eventDivisionAssignmentId") or None
+            ),
+            event_id=_to_int(data.get("eventId") or None),
+            maximum_teams=_to_int(data.get("maximumTeams") or None),
+        )
 
-        rec.start_date = _fmt_date(data.get("startDate"))
-        rec.end_date = _fmt_date(data.get("endDate"))
+    async def _get_body_async(self, client, sem: asyncio.Semaphore, url: str) -> bytes:
+        # The response cache, checked and revalidated like CachingAdapter.
+        ttl = self.cache.ttl_for(url) if self.cache is not None else 0
+        entry = self.cache.backend.get(url) if ttl > 0 else None
+        if entry is not None and time.time() - entry["stored_at"] < ttl:
+            if self.metrics is not None:
+                self._record_request(url, time.perf_counter(), len(entry["body"]))
+            return entry["body"]
+        headers = {}
+        if entry is not None:
+            stored = CaseInsensitiveDict(entry["headers"])
+            if stored.get("ETag"):
+                headers["If-None-Match"] = stored["ETag"]
+            if stored.get("Last-Modified"):
+                headers["If-Modified-Since"] = stored["Last-Modified"]
 
-        return rec
+        async with sem:
+            if self.limiter is not None:
+                await self.limiter.acquire_async()
+            # Like ThrottledAdapter.send, one slot covers every retry, so a
+            # request sleeping on Retry-After still counts against the limit.
+            if self.concurrency is not None:
+                await self.concurrency.acquire_async()
+            # request_seconds starts here, after the pacing waits.
+            started = time.perf_counter()
+            statuses: List[int] = []
+            failed = False
+            try:
+                for attempt in range(RETRY_TOTAL + 1):
+                    if attempt and self.limiter is not None:
+                        await self.limiter.acquire_async()
+                    retry_after = None
+                    try:
+                        async with client.get(url, headers=headers) as r:
+                            statuses.append(r.status)
+                            if r.status in RETRY_STATUSES and attempt < RETRY_TOTAL:
+                                if r.status in RETRY_AFTER_STATUSES:
+                                    retry_after = _retry_after(
+                                        r.headers.get("Retry-After")
+                                    )
+                                await r.read()
+                            else:
+                                if self.metrics is not None and not r.ok:
+                                    self._record_request(
+                                        url, started, retries=attempt, failed=True
+                                    )
+                                r.raise_for_status()
+                                if r.status == 304 and entry is not None:
+                                    entry["stored_at"] = time.time()
+                                    self.cache.backend.set(url, entry)
+                                    body = entry["body"]
+                                else:
+                                    body = await r.read()
+                                    if (
+                                        self.fixtures is not None
+                                        and not self.fixtures.replay
+                                    ):
+                                        self.fixtures.save(
+                                            url, r.status, r.headers, body
+                                        )
+                                    if ttl > 0 and r.status == 200:
+                                        self.cache.backend.set(
+                                            url,
+                                            {
+                                                "status": r.status,
+                                                "headers": _stored_headers(r.headers),
+                                                "stored_at": time.time(),
+                                                "body": body,
+                                            },
+                                        )
+                                if self.metrics is not None:
+                                    self._record_request(
+                                        url, started, len(body), attempt
+                                    )
+                                return body
+                    except aiohttp.ClientResponseError:
+                        raise  # final status from raise_for_status, not retryable
+                    except (aiohttp.ClientError, asyncio.TimeoutError):
+                        # Connection, read and timeout errors are retried like
+                        # urllib3's Retry(total=RETRY_TOTAL) does for requests.
+                        if attempt == RETRY_TOTAL:
+                            raise
+                    await asyncio.sleep(
+                        retry_after
+                        if retry_after is not None
+                        else RETRY_BACKOFF * (2**attempt) * random.uniform(0.5, 1)
+                    )
+            except aiohttp.ClientResponseError:
+                raise  # recorded above with its status
+            except Exception:
+                failed = True  # no usable response, as in ThrottledAdapter.send
+                if self.metrics is not None:
+                    self._record_request(url, started, retries=attempt, failed=True)
+                raise
+            finally:
+                if self.concurrency is not None:
+                    self.concurrency.release(
+                        time.perf_counter() - started, statuses, failed=failed
+                    )
 
-    def parse_division_api(self, data: Dict[str, Any]) -> DivisionRecord:
-        rec = DivisionRecord()
-        rec.event_id = str(data.get("eventId") or "")
-        rec.description = str(data.get("description") or "")
+    async def _fetch_one_event_async(self, client, sem, item: dict) -> EventRecord:
+        url = self._event_detail_url(item)
 
-        rec.entry_fee = str(data.get("entryFee") or "0")
+        async def fetch() -> EventRecord:
+            return self.decode_event(await self._get_body_async(client, sem, url))
 
-        rec.event_division_assignment_id = str(
-            data.get("eventDivisionAssignmentId") or ""
-        )
-        rec.event_id = str(data.get("eventId") or "")
-        rec.maximum_teams = str(data.get("maximumTeams") or "")
-        return rec
+        return await self.flight.do_async(url, fetch)
 
-    def run(self, out_path: str, workers: int) -> None:
-        count = self.fetch_total_counts()
-        events = self.fetch_events(round(count, 2))
+    async def _fetch_one_division_async(
+        self, client, sem, event: Dict[str, Any]
+    ) -> List[DivisionRecord]:
+        url = self._division_url(event)
+        if url is None:
+            return []
 
-        event_records: List[EventRecord] = []
-        event_errors: List[Dict[str, str]] = []
+        async def fetch() -> List[DivisionRecord]:
+            return self.decode_divisions(await self._get_body_async(client, sem, url))
 
-        division_records: List[DivisionRecord] = []
-        division_errors: List[Dict[str, str]] = []
+        return await self.flight.do_async(url, fetch)
 
-        with ThreadPoolExecutor(max_workers=workers) as ex:
-            futures = {
-                ex.submit(self._fetch_one_division, event): event for event in events
-            }
-            for fut in as_completed(futures):
-                try:
-                    recs = fut.result()
-                    if recs:
-                        division_records.extend(recs)
-                except Exception as e:
-                    item = futures[fut]
-                    division_errors.append(
-                        {
-                            "where": "detail",
-                            "message": repr(e),
-                            "item": json.dumps(item)[:500],
-                        }
+    async def _fetch_all_async(
+        self, events: Iterable[dict], concurrency: int, on_done: Callable[..., None]
+    ) -> None:
+        """Fetch divisions and details for every event over one aiohttp connection pool."""
+        if aiohttp is None:
+            raise RuntimeError("--engine async requires aiohttp (pip install aiohttp)")
+
+        sem = asyncio.Semaphore(concurrency)
+        connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=concurrency)
+        timeout = aiohttp.ClientTimeout(sock_connect=5, sock_read=120)
+
+        async def task(kind: str, event: dict, coro) -> None:
+            try:
+                result = await coro
+            except Exception as e:
+                on_done(kind, event, None, e)
+            else:
+                on_done(kind, event, result, None)
+
+        async with aiohttp.ClientSession(
+            headers=HEADERS, connector=connector, timeout=timeout
+        ) as client:
+            if self.fixtures is not None and self.fixtures.replay:
+                client = ReplayClient(self.fixtures)
+            tasks = []
+            # The listing is paged over blocking HTTP; pull it off the loop so
+            # fetches for earlier pages keep running while the next one loads.
+            it = iter(events)
+            while True:
+                event = await asyncio.to_thread(next, it, None)
+                if event is None:
+                    break
+                tasks.append(
+                    asyncio.create_task(
+                        task(
+                            "division",
+                            event,
+                            self._fetch_one_division_async(client, sem, event),
+                        )
+                    )
+                )
+                tasks.append(
+                    asyncio.create_task(
+                        task(
+                            "event",
+                            event,
+                            self._fetch_one_event_async(client, sem, event),
+                        )
                     )
+                )
+            await asyncio.gather(*tasks)
 
-        with ThreadPoolExecutor(max_workers=workers) as ex:
-            futures = {
-                ex.submit(self._fetch_one_event, event): event for event in events
-            }
-            for fut in as_completed(futures):
-                try:
-                    rec = fut.result()
-                    event_records.append(rec)
-                except Exception as e:
-                    item = futures[fut]
-                    event_errors.append(
-                        {
-                            "where": "detail",
-                            "message": repr(e),
-                            "item": json.dumps(item)[:500],
-                        }
+    def _fetch_all_threaded(
+        self, events: Iterable[dict], workers: int, on_done: Callable[..., None]
+    ) -> None:
+        """Fetch divisions and details for every event from one shared thread pool.
+
+        Events are read from the listing as fast as it arrives; at most
+        ``2 * workers`` fetches are submitted to the pool at a time and the
+        rest wait in a local backlog. Completions are handed to ``on_done``
+        on the calling thread. If the listing raises or the run is
+        interrupted, queued fetches are cancelled and those that already
+        finished still reach ``on_done`` (and so the journal) before the
+        error propagates.
+        """
+        done: "queue.Queue" = queue.Queue()
+        backlog: Deque[dict] = deque()
+        limit = 2 * workers
+        pending = 0
+
+        def finish(kind: str, event: dict, fut) -> None:
+            try:
+                result = fut.result()
+            except Exception as e:
+                on_done(kind, event, None, e)
+            else:
+                on_done(kind, event, result, None)
+
+        def submit_backlog() -> None:
+            nonlocal pending
+            while backlog and pending < limit:
+                event = backlog.popleft()
+                for kind, fn in (
+                    ("division", self._fetch_one_division),
+                    ("event", self._fetch_one_event),
+                ):
+                    fut = ex.submit(fn, event)
+                    fut.add_done_callback(
+                        lambda f, kind=kind, event=event: done.put((kind, event, f))
                     )
+                    pending += 1
 
-        df_events = pd.DataFrame([asdict(r) for r in event_records])
-        df_divisions = pd.DataFrame([asdict(r) for r in division_records])
+        def drain(block: bool) -> None:
+            """Finish completed fetches, refilling the pool from the backlog."""
+            nonlocal pending
+            while pending:
+                try:
+                    item = done.get(block=block)
+                except queue.Empty:
+                    return
+                pending -= 1
+                finish(*item)
+                submit_backlog()
 
-        with pd.ExcelWriter(out_path, engine="xlsxwriter") as xw:
-            df_events.to_excel(xw, index=False, sheet_name="events")
-            if event_errors:
-                pd.DataFrame(event_errors).to_excel(
-                    xw, index=False, sheet_name="event_errors"
-                )
+        # Not a with-block: its exit would wait for every queued fetch.
+        ex = ThreadPoolExecutor(max_workers=workers)
+        try:
+            # The listing is not held back by the pool, so a streamed page
+            # is not kept open for the whole run.
+            for event in events:
+                backlog.append(event)
+                submit_backlog()
+                drain(block=False)
+            drain(block=True)
+        except BaseException:
+            # Running fetches finish; queued ones are cancelled and skipped.
+            ex.shutdown(cancel_futures=True)
+            while True:
+                try:
+                    kind, event, fut = done.get_nowait()
+                except queue.Empty:
+                    break
+                if not fut.cancelled():
+                    finish(kind, event, fut)
+            raise
+        ex.shutdown()
+
+    @staticmethod
+    def _error_row(e: BaseException, item: Dict[str, Any]) -> Dict[str, str]:
+        return {
+            "where": "detail",
+            "message": repr(e),
+            "item": json.dumps(item)[:500],
+        }
+
+    def run(
+        self,
+        out_path: str,
+        workers: int,
+        engine: str = "thread",
+        page_size: int = 500,
+        listing_workers: int = 4,
+        state_path: Optional[str] = None,
+        journal_path: Optional[str] = None,
+        resume: bool = False,
+        fmt: str = "xlsx",
+        sink_options: Optional[Dict[str, Any]] = None,
+        date_style: str = "us",
+        progress_interval: float = 5.0,
+        progress_path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Fetch, filter and export every listed event; returns a run summary."""
+        if self.concurrency is not None:
+            # Workers only bound the pool; the adaptive limit gates requests.
+            workers = self.concurrency.maximum
+
+        if self.pool_size is None:
+            self.pool_size = workers + listing_workers
+        listing_meta: Dict[str, Any] = {}
+        events = self.iter_events(page_size, workers=listing_workers, meta=listing_meta)
+        progress = None
+        if progress_interval > 0:
+            progress = ProgressReporter(
+                progress_interval,
+                progress_path,
+                extra=(
+                    (lambda: {"in_flight_limit": int(self.concurrency.limit)})
+                    if self.concurrency is not None
+                    else None
+                ),
+            )
+        store = StateStore(state_path) if state_path else None
+        journal = Journal(journal_path, resume) if journal_path else None
+
+        # Records go straight to the sink as they complete; only counts are kept.
+        sink = SINKS[fmt](out_path, **(sink_options or {}))
+        counts = {table: 0 for table in TABLE_COLUMNS}
+        # Time spent rendering rows (record -> dict, date formatting) and
+        # inside the sink, for the run summary and metrics.
+        build_seconds = export_seconds = 0.0
+
+        # Records carry the API's ISO timestamps; they are rendered for the
+        # sink here, once per distinct value thanks to format_date's cache.
+        format_dates = not getattr(sink, "native_dates", False)
 
-            df_divisions.to_excel(xw, index=False, sheet_name="divisions")
-            if division_errors:
-                pd.DataFrame(division_errors).to_excel(
-                    xw, index=False, sheet_name="division_errors"
+        def emit(table: str, row: Dict[str, Any]) -> None:
+            nonlocal build_seconds, export_seconds
+            t0 = time.perf_counter()
+            if table == "events" and format_dates:
+                for column in DATE_COLUMNS:
+                    row[column] = format_date(row[column], date_style)
+            t1 = time.perf_counter()
+            sink.write(table, row)
+            build_seconds += t1 - t0
+            export_seconds += time.perf_counter() - t1
+            counts[table] += 1
+
+        # Columnar sinks take records as they are; the rest get row dicts.
+        write_record = getattr(sink, "write_record", None)
+
+        def emit_records(table: str, recs: List[Any]) -> None:
+            nonlocal build_seconds, export_seconds
+            t0 = time.perf_counter()
+            if write_record is not None:
+                for rec in recs:
+                    write_record(table, rec)
+                export_seconds += time.perf_counter() - t0
+                counts[table] += len(recs)
+                return
+            to_row = event_row if table == "events" else division_row
+            rows = [to_row(rec) for rec in recs]
+            build_seconds += time.perf_counter() - t0
+            for row in rows:
+                emit(table, row)
+
+        if journal is not None and journal.completed:
+            for event_rec, division_recs in journal.completed.values():
+                emit_records("events", [event_rec])
+                emit_records("divisions", division_recs)
+            print(
+                f"Resume: restored {len(journal.completed)} completed events from {journal_path}"
+            )
+
+        started = time.perf_counter()
+        phase_end = {"division": started, "event": started}
+        # The async engine pulls the listing from a worker thread, so results
+        # can arrive from more than one thread.
+        lock = threading.Lock()
+        # Fetched results per event, held until both halves are in the store.
+        halves: Dict[str, Dict[str, Any]] = {}
+        reused = 0
+
+        def collect(kind, event, result, error):
+            if error is not None:
+                row = self._error_row(error, event)
+                emit(f"{kind}_errors", row)
+                if journal is not None:
+                    journal.write("error", _event_key(event), row)
+            else:
+                if journal is not None:
+                    journal.write(kind, _event_key(event), result)
+                if kind == "division":
+                    emit_records("divisions", result)
+                else:
+                    emit_records("events", [result])
+            phase_end[kind] = time.perf_counter()
+            if progress is not None:
+                progress.done(
+                    "divisions" if kind == "division" else "details",
+                    failed=error is not None,
                 )
 
+        def on_done(kind, event, result, error):
+            with lock:
+                collect(kind, event, result, error)
+                if store is None:
+                    return
+                key = _event_key(event)
+                if error is not None:
+                    halves.pop(key, None)
+                    return
+                got = halves.setdefault(key, {})
+                got[kind] = result
+                if len(got) == 2:
+                    del halves[key]
+                    store.save(key, _fingerprint(event), got["event"], got["division"])
+
+        def changed_only(events: Iterable[dict]) -> Iterator[dict]:
+            nonlocal reused
+            for event in events:
+                with lock:
+                    cached = store.lookup(_event_key(event), _fingerprint(event))
+                    if cached is not None:
+                        collect("event", event, cached[0], None)
+                        collect("division", event, cached[1], None)
+                        reused += 1
+                if cached is None:
+                    yield event
+
+        filtered_out = 0
+        duplicates = 0
+
+        def unique(events: Iterable[dict]) -> Iterator[dict]:
+            nonlocal duplicates
+            seen = set()
+            for event in events:
+                key = _event_key(event)
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+                yield event
+
+        def wanted(events: Iterable[dict]) -> Iterator[dict]:
+            nonlocal filtered_out
+            for event in events:
+                if self.event_filter.matches(event):
+                    yield event
+                else:
+                    filtered_out += 1
+
+        def not_completed(events: Iterable[dict]) -> Iterator[dict]:
+            for event in events:
+                if _event_key(event) not in journal.completed:
+                    yield event
+
+        def listed(events: Iterable[dict]) -> Iterator[dict]:
+            for event in events:
+                progress.listed(listing_meta.get("@odata.count"))
+                yield event
+            progress.finish_listing()
+
+        def submitted(events: Iterable[dict]) -> Iterator[dict]:
+            for event in events:
+                progress.submit()
+                yield event
+
+        if progress is not None:
+            events = listed(events)
+        events = unique(events)
+        if self.event_filter is not None:
+            events = wanted(events)
+        if journal is not None and journal.completed:
+            events = not_completed(events)
+        if progress is not None:
+            # Counted before changed_only, whose reused events still complete.
+            events = submitted(events)
+        if store is not None:
+            events = changed_only(events)
+
+        try:
+            if engine == "async":
+                asyncio.run(self._fetch_all_async(events, workers, on_done))
+            else:
+                self._fetch_all_threaded(events, workers, on_done)
+        finally:
+            if store is not None:
+                store.close()
+            if journal is not None:
+                journal.close()
+            if progress is not None:
+                progress.close()
+            t0 = time.perf_counter()
+            sink.close()
+            export_seconds += time.perf_counter() - t0
+
+        finished = time.perf_counter()
+        if self.metrics is not None:
+            self.metrics.observe("run_seconds", finished - started)
+            self.metrics.inc("build_seconds_total", build_seconds)
+            self.metrics.inc("write_seconds_total", export_seconds, format=fmt)
+            for table, n in counts.items():
+                self.metrics.inc("rows_total", n, table=table)
+        if duplicates or self.flight.coalesced:
+            print(
+                f"Dedup: dropped {duplicates} duplicate listing events, "
+                f"coalesced {self.flight.coalesced} in-flight requests"
+            )
+        if self.event_filter is not None:
+            print(f"Filter: skipped {filtered_out} listing events")
+        if store is not None:
+            print(f"Incremental: reused {reused} unchanged events from {state_path}")
+        print(
+            f"Fetch: divisions done after {phase_end['division'] - started:.2f}s, "
+            f"details done after {phase_end['event'] - started:.2f}s, "
+            f"total {finished - started:.2f}s"
+        )
+
         print(
-            f"Wrote {len(event_records)} events to {out_path}. Errors: {len(event_errors)}"
+            f"Wrote {counts['events']} events to {out_path}. Errors: {counts['event_errors']}"
         )
         print(
             "----------------------------------------------------------------------------"
         )
         print(
-            f"Wrote {len(division_records)} divisions to {out_path}. Errors: {len(division_errors)}"
+            f"Wrote {counts['divisions']} divisions to {out_path}. Errors: {counts['division_errors']}"
+        )
+        return {
+            **counts,
+            "duplicates": duplicates,
+            "filtered_out": filtered_out,
+            "reused": reused,
+            "seconds": finished - started,
+            "build_seconds": build_seconds,
+            "export_seconds": export_seconds,
+        }
+
+
+# Innermost-frame function names that mean a sampled thread was parked;
+# "_worker" is an executor thread blocked on its (C-level) work queue.
+_IDLE_FUNCTIONS = frozenset(
+    (
+        "wait",
+        "get",
+        "acquire",
+        "select",
+        "poll",
+        "sleep",
+        "_wait_for_tstate_lock",
+        "_worker",
+    )
+)
+
+
+def _stage_codes() -> Dict[Any, str]:
+    """Code objects that mark the start of each profiled stage."""
+    stages = {
+        "listing": [AESScraper.iter_events],
+        "request": [AESScraper._get_body, AESScraper._get_body_async],
+        "parse": [AESScraper.decode_event, AESScraper.decode_divisions],
+        "export": [],
+    }
+    for sink in SINKS.values():
+        cls = getattr(sink, "func", sink)
+        stages["export"].extend((cls.write, cls.close))
+        # Columnar sinks take records directly and flush batches mid-run.
+        for name in ("write_record", "_flush"):
+            if hasattr(cls, name):
+                stages["export"].append(getattr(cls, name))
+    return {fn.__code__: stage for stage, fns in stages.items() for fn in fns}
+
+
+def _code_label(code) -> str:
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class CProfileProfiler:
+    """Deterministic cProfile of the calling thread and every thread it starts.
+
+    From Python 3.12 cProfile is built on sys.monitoring, so one Profile
+    already sees every thread (and a second one cannot be enabled). Before
+    that, each new thread gets its own cProfile.Profile through
+    threading.setprofile and all of them are merged for the report.
+    Per-stage figures are cumulative times summed over threads.
+    """
+
+    suffix = ".prof"
+    per_thread = sys.version_info < (3, 12)
+
+    def __init__(self, interval: float = 0.0):
+        self.profiles: List[cProfile.Profile] = []
+
+    def _start_thread(self, frame, event, arg) -> None:
+        prof = cProfile.Profile()
+        try:
+            prof.enable()
+        except ValueError:
+            return  # another profiler is active; this thread goes unprofiled
+        self.profiles.append(prof)
+
+    def start(self) -> None:
+        prof = cProfile.Profile()
+        self.profiles.append(prof)
+        if self.per_thread:
+            threading.setprofile(self._start_thread)
+        prof.enable()
+
+    def stop(self) -> None:
+        self.profiles[0].disable()
+        if self.per_thread:
+            threading.setprofile(None)
+
+    def report(self, path: str, top: int) -> None:
+        stats = pstats.Stats(*self.profiles)
+        stats.dump_stats(path)
+        codes = _stage_codes()
+        keys = {
+            (c.co_filename, c.co_firstlineno, c.co_name): stage
+            for c, stage in codes.items()
+        }
+        per_stage: Dict[str, float] = {}
+        for key, (_, _, _, cumulative, _) in stats.stats.items():
+            if key in keys:
+                per_stage[keys[key]] = per_stage.get(keys[key], 0.0) + cumulative
+        threads = f" ({len(self.profiles)} threads)" if self.per_thread else ""
+        print(f"Profile{threads} written to {path}")
+        print("Per-stage cumulative time (summed over threads):")
+        for stage, seconds in sorted(per_stage.items(), key=lambda kv: -kv[1]):
+            print(f"  {stage:<8} {seconds:9.3f}s")
+        stats.sort_stats("tottime").print_stats(top)
+
+
+class SamplingProfiler:
+    """Low-overhead wall-clock sampler over all threads.
+
+    A background thread snapshots every thread's stack each ``interval``
+    seconds via sys._current_frames(). Each sample is attributed to the
+    innermost stage function on its stack, or to "idle" when the thread
+    is parked in a wait. Stacks are written in folded format
+    (flamegraph.pl / speedscope).
+    """
+
+    suffix = ".folded"
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(frame.f_code)
+                    frame = frame.f_back
+                self.samples[tuple(stack)] += 1
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="profile-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def report(self, path: str, top: int) -> None:
+        codes = _stage_codes()
+        per_stage: Counter = Counter()
+        own: Counter = Counter()
+        total: Counter = Counter()
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, n in self.samples.items():
+                stage = next((codes[c] for c in stack if c in codes), None)
+                if stage is None:
+                    stage = "idle" if stack[0].co_name in _IDLE_FUNCTIONS else "other"
+                per_stage[stage] += n
+                if stage != "idle":
+                    own[stack[0]] += n
+                    for code in set(stack):
+                        total[code] += n
+                f.write(";".join(_code_label(c) for c in reversed(stack)))
+                f.write(f" {n}\n")
+
+        count = sum(per_stage.values())
+        busy = count - per_stage["idle"]
+        print(
+            f"Profile: {count} thread samples every {self.interval * 1000:g}ms "
+            f"written to {path}"
         )
+        print("Per-stage share of thread samples:")
+        for stage, n in per_stage.most_common():
+            print(f"  {stage:<8} {n:8d}  {n / count:6.1%}")
+        if not busy:
+            return
+        print(f"Top {top} functions by own samples (excluding idle):")
+        for code, n in own.most_common(top):
+            print(
+                f"  {n:8d} {n / busy:6.1%} own {total[code] / busy:6.1%} total  "
+                f"{_code_label(code)}"
+            )
+
+
+PROFILERS = {"cprofile": CProfileProfiler, "sample": SamplingProfiler}
 
 
 def main():
     p = argparse.ArgumentParser()
     p.add_argument(
-        "--workers", type=int, default=8, help="Parallel workers for detail pages"
+        "--workers",
+        type=int,
+        default=8,
+        help="Parallel workers for detail pages (in-flight requests with --engine async)",
+    )
+    p.add_argument(
+        "--engine",
+        choices=("thread", "async"),
+        default="thread",
+        help="Fetch engine: thread pool or asyncio/aiohttp",
+    )
+    p.add_argument(
+        "--page-size",
+        type=int,
+        default=500,
+        help="Events per listing page ($top)",
+    )
+    p.add_argument(
+        "--listing-workers",
+        type=int,
+        default=4,
+        help="Parallel requests for listing pages",
+    )
+    p.add_argument(
+        "--json-backend",
+        choices=["auto"] + list(json_backends()),
+        default="auto",
+        help="JSON decoder for API responses (auto picks the fastest installed)",
+    )
+    p.add_argument(
+        "--decoder",
+        choices=("dict", "struct"),
+        default="dict",
+        help="Decode detail/division JSON into dicts or typed msgspec structs",
+    )
+    p.add_argument(
+        "--start-from",
+        type=date.fromisoformat,
+        help="Only events starting on or after this date (YYYY-MM-DD)",
+    )
+    p.add_argument(
+        "--start-to",
+        type=date.fromisoformat,
+        help="Only events starting on or before this date (YYYY-MM-DD)",
+    )
+    p.add_argument(
+        "--state-abbr",
+        action="append",
+        default=[],
+        help="Only events in this state (e.g. TX); repeatable",
+    )
+    p.add_argument(
+        "--event-type",
+        type=re.compile,
+        help="Only events whose affiliation/event type matches this regex",
+    )
+    p.add_argument(
+        "--name",
+        type=re.compile,
+        help="Only events whose name matches this regex",
+    )
+    p.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only refetch events whose listing row changed since the last run",
+    )
+    p.add_argument(
+        "--state",
+        default="aes_state.sqlite",
+        help="SQLite state file used by --incremental",
+    )
+    p.add_argument(
+        "--cache",
+        help="Cache responses on disk at this path (directory, or file with --cache-backend sqlite)",
+    )
+    p.add_argument(
+        "--cache-backend",
+        choices=("file", "sqlite"),
+        default="file",
+        help="Storage used by --cache",
+    )
+    p.add_argument(
+        "--cache-ttl",
+        type=_cache_ttl_rule,
+        action="append",
+        default=[],
+        metavar="REGEX=SECONDS",
+        help="TTL for URLs matching REGEX; repeatable, checked before the defaults",
+    )
+    p.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=0,
+        help="Evict least recently used cache entries above this size (0 = unbounded)",
+    )
+    p.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Adapt in-flight requests (AIMD) to latency and 429/5xx, starting at --workers",
+    )
+    p.add_argument(
+        "--max-workers",
+        type=int,
+        default=128,
+        help="Upper bound for the in-flight limit with --adaptive",
+    )
+    p.add_argument(
+        "--pool",
+        choices=("thread", "shared"),
+        default="thread",
+        help="Connection pooling: one session per thread, or one shared session",
+    )
+    p.add_argument(
+        "--pool-size",
+        type=int,
+        help="Keep-alive connections for --pool shared (default: workers + listing workers)",
+    )
+    p.add_argument(
+        "--checkpoint",
+        help="Journal finished fetches to this JSON Lines file (default: <out>.journal.jsonl; aes_events.postgres.journal.jsonl with --format postgres)",
+    )
+    p.add_argument(
+        "--resume",
+        action="store_true",
+        help="Restore events completed in the checkpoint journal and skip refetching them",
+    )
+    p.add_argument(
+        "--no-checkpoint",
+        action="store_true",
+        help="Do not write a checkpoint journal",
+    )
+    p.add_argument(
+        "--base",
+        default=BASE,
+        help="API root URL (e.g. http://127.0.0.1:8000 for mock_server.py)",
+    )
+    p.add_argument(
+        "--record",
+        metavar="DIR",
+        help="Save every response under DIR for later --replay",
+    )
+    p.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="Serve responses recorded with --record from DIR instead of the network",
+    )
+    p.add_argument(
+        "--replay-latency",
+        type=float,
+        default=0.0,
+        help="Synthetic latency per replayed response (seconds)",
+    )
+    p.add_argument(
+        "--replay-jitter",
+        type=float,
+        default=0.0,
+        help="Extra uniform random latency per replayed response, up to this many seconds",
+    )
+    p.add_argument(
+        "--out",
+        default="aes_events.xlsx",
+        help="Output file path (a DSN with --format postgres)",
+    )
+    p.add_argument(
+        "--format",
+        choices=sorted(SINKS),
+        default="xlsx",
+        help="Output format; csv/jsonl/parquet/arrow write one <out stem>.<table> file per table",
+    )
+    p.add_argument(
+        "--date-format",
+        choices=DATE_STYLES,
+        default="us",
+        help="Event dates as mm/dd/yyyy strings, ISO strings or real dates (parquet, arrow and databases always use dates)",
+    )
+    p.add_argument(
+        "--partition-by-month",
+        action="store_true",
+        help="Partition the parquet/arrow events table by start month",
+    )
+    p.add_argument(
+        "--progress-interval",
+        type=float,
+        default=5.0,
+        help="Seconds between progress reports (0 disables them)",
+    )
+    p.add_argument(
+        "--progress-file",
+        default=None,
+        help="Also append each progress report to this file as JSON Lines",
+    )
+    p.add_argument(
+        "--profile",
+        choices=sorted(PROFILERS),
+        default=None,
+        help="Profile the run: deterministic cProfile, or low-overhead stack sampling across threads",
+    )
+    p.add_argument(
+        "--profile-out",
+        default=None,
+        help="Profile output file (default: <out>.prof, or <out>.folded for sample)",
+    )
+    p.add_argument(
+        "--profile-top",
+        type=int,
+        default=25,
+        help="Functions to list in the profile summary",
+    )
+    p.add_argument(
+        "--profile-interval",
+        type=float,
+        default=5.0,
+        help="Milliseconds between stack samples for --profile sample",
+    )
+    p.add_argument(
+        "--metrics",
+        action="append",
+        choices=sorted(METRICS_SINKS),
+        default=[],
+        help="Report per-stage timings: log summary, <out>.metrics.json or <out>.prom (repeatable)",
+    )
+    p.add_argument(
+        "--metrics-path",
+        default=None,
+        help="Path stem for --metrics json/prometheus files (default: --out, or aes_events.postgres)",
+    )
+    p.add_argument(
+        "--delay",
+        type=float,
+        default=0.4,
+        help="Delay between requests (seconds); sets the rate limit when --rate is not given, 0 disables it",
+    )
+    p.add_argument(
+        "--rate",
+        type=float,
+        help="Global request rate limit (requests/second) shared by all workers",
     )
-    p.add_argument("--out", default="aes_events.xlsx", help="Output Excel file path")
     p.add_argument(
-        "--delay", type=float, default=0.4, help="Delay between requests (seconds)"
+        "--burst",
+        type=int,
+        default=1,
+        help="Requests allowed back to back before the rate limit applies",
     )
 
     p.add_argument(
@@ -271,9 +3248,107 @@ def main():
     )
 
     args = p.parse_args()
+    if args.record and args.replay:
+        p.error("--record and --replay are mutually exclusive")
+    if args.partition_by_month and args.format not in ("parquet", "arrow"):
+        p.error("--partition-by-month needs --format parquet or arrow")
+
+    event_filter = None
+    if (
+        args.start_from
+        or args.start_to
+        or args.state_abbr
+        or args.event_type
+        or args.name
+    ):
+        event_filter = EventFilter(
+            start_from=args.start_from,
+            start_to=args.start_to,
+            states=frozenset(s.upper() for s in args.state_abbr),
+            event_type=args.event_type,
+            name=args.name,
+        )
 
-    scraper = AESScraper(delay_sec=args.delay, is_past_events=args.past_events)
-    scraper.run(args.out, workers=args.workers)
+    cache = None
+    if args.cache:
+        max_bytes = int(args.cache_max_mb * 1024 * 1024)
+        backend = (
+            SQLiteCacheBackend(args.cache, max_bytes)
+            if args.cache_backend == "sqlite"
+            else FileCacheBackend(args.cache, max_bytes)
+        )
+        cache = ResponseCache(
+            backend, args.cache_ttl + default_cache_ttls(args.past_events)
+        )
+
+    scraper = AESScraper(
+        delay_sec=args.delay,
+        is_past_events=args.past_events,
+        cache=cache,
+        rate=args.rate,
+        burst=args.burst,
+        concurrency=(
+            AdaptiveConcurrency(args.workers, maximum=args.max_workers)
+            if args.adaptive
+            else None
+        ),
+        pool=args.pool,
+        pool_size=args.pool_size,
+        base=args.base,
+        fixtures=(
+            FixtureStore(args.record, "record")
+            if args.record
+            else (
+                FixtureStore(
+                    args.replay, "replay", args.replay_latency, args.replay_jitter
+                )
+                if args.replay
+                else None
+            )
+        ),
+        event_filter=event_filter,
+        json_backend=args.json_backend,
+        decoder=args.decoder,
+        metrics=Metrics() if args.metrics else None,
+    )
+    # Stem for the journal, metrics and profile files. With postgres --out is
+    # a DSN (possibly holding a password), so it never goes into a file name.
+    stem = "aes_events.postgres" if args.format == "postgres" else args.out
+
+    profiler = None
+    if args.profile:
+        profiler = PROFILERS[args.profile](args.profile_interval / 1000)
+        profiler.start()
+    try:
+        scraper.run(
+            args.out,
+            workers=args.workers,
+            engine=args.engine,
+            page_size=args.page_size,
+            listing_workers=args.listing_workers,
+            state_path=args.state if args.incremental else None,
+            journal_path=(
+                None
+                if args.no_checkpoint
+                else args.checkpoint or f"{stem}.journal.jsonl"
+            ),
+            resume=args.resume,
+            fmt=args.format,
+            sink_options=(
+                {"partition_by_month": True} if args.partition_by_month else None
+            ),
+            date_style=args.date_format,
+            progress_interval=args.progress_interval,
+            progress_path=args.progress_file,
+        )
+    finally:
+        if profiler is not None:
+            profiler.stop()
+            profiler.report(
+                args.profile_out or f"{stem}{profiler.suffix}", args.profile_top
+            )
+    for kind in dict.fromkeys(args.metrics):
+        METRICS_SINKS[kind](args.metrics_path or stem).emit(scraper.metrics)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,343 @@
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+STATES = ["TX", "CA", "FL", "IL", "OH", "GA", "AZ", "CO", "NY", "WA"]
+AFFILIATIONS = ["AAU", "USAV", "JVA", ""]
+EVENT_TYPES = ["Tournament", "League", "Camp", "Tryout"]
+DIVISIONS = ["12s", "13s", "14s", "15s", "16s", "17s", "18s"]
+
+FILTER_CLAUSE = re.compile(r"^(\w+) (eq|ne|ge|gt|le|lt) (.+)$")
+COMPARE: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": lambda a, b: a == b,
+    "ne": lambda a, b: a != b,
+    "ge": lambda a, b: a >= b,
+    "gt": lambda a, b: a > b,
+    "le": lambda a, b: a <= b,
+    "lt": lambda a, b: a < b,
+}
+
+EVENT_PATH = re.compile(r"^/api/landing/events/(scheduler/)?(\d+)$")
+DIVISIONS_PATH = re.compile(r"^/api/landing/events/(\d+)/divisions$")
+
+
+def build_dataset(
+    events: int, divisions: int, scheduler_share: float, seed: int
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Deterministic listing items plus detail payloads keyed by ("event"|"scheduler", id)."""
+    rng = random.Random(seed)
+    today = date.today()
+    listing, details = [], {}
+    for i in range(1, events + 1):
+        start = today + timedelta(days=rng.randint(-730, 365))
+        end = start + timedelta(days=rng.randint(0, 2))
+        scheduler = rng.random() < scheduler_share
+        event_id = None if scheduler else i
+        payload = {
+            "eventId": event_id,
+            "eventSchedulerId": i if scheduler else None,
+            "name": f"Mock Event {i:06d}",
+            "isPastEvent": start < today,
+            "startDate": f"{start.isoformat()}T00:00:00",
+            "endDate": f"{end.isoformat()}T00:00:00",
+            "hostName": f"Club {rng.randint(1, 500)}",
+            "locationName": f"Arena {rng.randint(1, 200)}",
+            "website": f"https://club{i}.example.com",
+            "email": f"director{i}@example.com",
+            "affiliation": {"description": rng.choice(AFFILIATIONS)},
+            "eventType": {"description": rng.choice(EVENT_TYPES)},
+            "address": {
+                "line1": f"{rng.randint(1, 9999)} Main St",
+                "city": f"City {rng.randint(1, 300)}",
+                "state": {"abbreviation": rng.choice(STATES)},
+                "zip": f"{rng.randint(10000, 99999)}",
+            },
+        }
+        listing.append(payload)
+        details[("scheduler" if scheduler else "event", i)] = payload
+    listing.sort(key=lambda e: (e["startDate"], e["name"]))
+    return listing, {
+        "details": details,
+        "divisions": divisions,
+        "seed": seed,
+    }
+
+
+def division_list(event_id: int, count: int, seed: int) -> Dict[str, Any]:
+    rng = random.Random(seed * 1_000_003 + event_id)
+    return {
+        "value": [
+            {
+                "eventId": event_id,
+                "description": f"{DIVISIONS[k % len(DIVISIONS)]} Open",
+                "entryFee": rng.choice([350, 425.5, 500, 650]),
+                "eventDivisionAssignmentId": event_id * 100 + k,
+                "maximumTeams": rng.choice([16, 24, 32, 48]),
+            }
+            for k in range(count)
+        ]
+    }
+
+
+def latency_sampler(
+    distribution: str, mean_ms: float, seed: int
+) -> Callable[[], float]:
+    """Per-request delay in seconds drawn from ``distribution`` with the given mean."""
+    rng = random.Random(seed)
+    lock = threading.Lock()
+    mean = mean_ms / 1000.0
+
+    def draw() -> float:
+        if mean <= 0:
+            return 0.0
+        with lock:
+            if distribution == "fixed":
+                return mean
+            if distribution == "uniform":
+                return rng.uniform(0, 2 * mean)
+            if distribution == "exponential":
+                return rng.expovariate(1 / mean)
+            # lognormal with sigma 1, scaled so the mean matches
+            return rng.lognormvariate(math.log(mean) - 0.5, 1.0)
+
+    return draw
+
+
+class ServerBucket:
+    """Server-side token bucket; callers over the limit get a 429."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self) -> Optional[float]:
+        """None if a token was taken, otherwise seconds until one is available."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return None
+            return (1 - self.tokens) / self.rate
+
+
+def filter_listing(items: List[Dict[str, Any]], expr: str) -> List[Dict[str, Any]]:
+    """Apply the ``and``-joined OData comparisons the scraper sends."""
+    checks = []
+    for clause in filter(None, (c.strip() for c in expr.split(" and "))):
+        m = FILTER_CLAUSE.match(clause)
+        if m is None:
+            raise ValueError(f"unsupported $filter clause: {clause!r}")
+        field, op, raw = m.groups()
+        value: Any = raw.strip("'")
+        if raw in ("true", "false"):
+            value = raw == "true"
+        elif field.endswith("Date"):
+            value = raw[:19].rstrip("Z")
+        checks.append((field, COMPARE[op], value))
+    return [
+        item
+        for item in items
+        if all(
+            item.get(field) is not None and op(item[field], value)
+            for field, op, value in checks
+        )
+    ]
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        if self.server.verbose:
+            super().log_message(*args)
+
+    def send_json(
+        self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None
+    ):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        server.count("requests")
+        if server.bucket is not None:
+            wait = server.bucket.take()
+            if wait is not None:
+                server.count("throttled")
+                return self.send_json(
+                    429,
+                    {"message": "Too Many Requests"},
+                    {"Retry-After": str(max(1, math.ceil(wait)))},
+                )
+        time.sleep(server.latency())
+        if server.error_rate and server.error_random() < server.error_rate:
+            server.count("errors")
+            return self.send_json(500, {"message": "Injected failure"})
+
+        url = urlparse(self.path)
+        if url.path == "/api/landing/events":
+            return self.listing(parse_qs(url.query))
+        m = DIVISIONS_PATH.match(url.path)
+        if m:
+            event_id = int(m.group(1))
+            if ("event", event_id) not in server.data["details"]:
+                return self.send_json(404, {"message": "Not Found"})
+            return self.send_json(
+                200,
+                division_list(event_id, server.data["divisions"], server.data["seed"]),
+            )
+        m = EVENT_PATH.match(url.path)
+        if m:
+            key = ("scheduler" if m.group(1) else "event", int(m.group(2)))
+            payload = server.data["details"].get(key)
+            if payload is None:
+                return self.send_json(404, {"message": "Not Found"})
+            return self.send_json(200, payload)
+        self.send_json(404, {"message": "Not Found"})
+
+    def listing(self, query: Dict[str, List[str]]):
+        try:
+            items = filter_listing(self.server.listing, query.get("$filter", [""])[0])
+            skip = int(query.get("$skip", ["0"])[0])
+            top = int(query.get("$top", [str(len(items))])[0])
+        except ValueError as e:
+            return self.send_json(400, {"message": str(e)})
+        payload: Dict[str, Any] = {}
+        if query.get("$count", ["false"])[0] == "true":
+            payload["@odata.count"] = len(items)
+        payload["value"] = items[skip : skip + top]
+        self.send_json(200, payload)
+
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        events: int = 1000,
+        divisions: int = 6,
+        scheduler_share: float = 0.02,
+        latency: str = "fixed",
+        latency_ms: float = 0.0,
+        error_rate: float = 0.0,
+        rate: Optional[float] = None,
+        burst: int = 50,
+        seed: int = 1,
+        verbose: bool = False,
+    ):
+        super().__init__(address, MockHandler)
+        self.listing, self.data = build_dataset(
+            events, divisions, scheduler_share, seed
+        )
+        self.latency = latency_sampler(latency, latency_ms, seed)
+        self.error_rate = error_rate
+        self.error_random = random.Random(seed + 1).random
+        self.bucket = ServerBucket(rate, burst) if rate else None
+        self.verbose = verbose
+        self.stats = {"requests": 0, "throttled": 0, "errors": 0}
+        self._stats_lock = threading.Lock()
+
+    def count(self, name: str):
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def serve(host: str = "127.0.0.1", port: int = 0, **options) -> MockServer:
+    """Start a MockServer on a background thread; call ``shutdown()`` when done."""
+    server = MockServer((host, port), **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    p = argparse.ArgumentParser(description="Local stand-in for the AES landing API")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8000)
+    p.add_argument("--events", type=int, default=1000, help="Dataset size")
+    p.add_argument("--divisions", type=int, default=6, help="Divisions per event")
+    p.add_argument(
+        "--scheduler-share",
+        type=float,
+        default=0.02,
+        help="Fraction of events only reachable through /scheduler/{id}",
+    )
+    p.add_argument(
+        "--latency",
+        choices=["fixed", "uniform", "exponential", "lognormal"],
+        default="fixed",
+        help="Response delay distribution",
+    )
+    p.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Mean response delay in ms"
+    )
+    p.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of requests answered with a 500",
+    )
+    p.add_argument(
+        "--rate",
+        type=float,
+        default=None,
+        help="Requests/sec before answering 429 with Retry-After",
+    )
+    p.add_argument("--burst", type=int, default=50, help="Burst size for --rate")
+    p.add_argument("--seed", type=int, default=1)
+    p.add_argument("--verbose", action="store_true", help="Log every request")
+    args = p.parse_args()
+
+    server = MockServer(
+        (args.host, args.port),
+        events=args.events,
+        divisions=args.divisions,
+        scheduler_share=args.scheduler_share,
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        rate=args.rate,
+        burst=args.burst,
+        seed=args.seed,
+        verbose=args.verbose,
+    )
+    print(f"Mock AES API with {len(server.listing)} events on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Served {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import os
+import sys
+from decimal import Decimal
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import AESScraper, DivisionRecord, EventRecord, Journal  # noqa: E402
+from mock_server import serve  # noqa: E402
+
+
+def _event(event_id: int) -> EventRecord:
+    return EventRecord(
+        event_id=event_id,
+        event_url=f"https://example.com/events/{event_id}",
+        name=f"Event {event_id}",
+        tournament_type="AAU Tournament",
+        host="Club",
+        location="Arena",
+        address="1 Main St, City, TX 75001",
+        website="",
+        email="",
+        start_date="2024-05-01T00:00:00",
+        end_date="2024-05-02T00:00:00",
+    )
+
+
+def _divisions(event_id: int):
+    return [
+        DivisionRecord(
+            description="16s Open",
+            entry_fee=Decimal("450.50"),
+            event_division_assignment_id=event_id * 10,
+            event_id=event_id,
+            maximum_teams=24,
+        )
+    ]
+
+
+def _write_events(journal: Journal, ids) -> None:
+    for i in ids:
+        journal.write("event", str(i), _event(i))
+        journal.write("division", str(i), _divisions(i))
+
+
+def _crash(path: str) -> None:
+    """Leave a torn, newline-less final line like an interrupted write."""
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"kind": "event", "key": "99", "resu')
+
+
+def test_resume_skips_torn_tail_and_keeps_appending(tmp_path):
+    path = str(tmp_path / "run.journal.jsonl")
+    journal = Journal(path)
+    _write_events(journal, range(1, 4))
+    journal.close()
+    _crash(path)
+
+    journal = Journal(path, resume=True)
+    assert sorted(journal.completed) == ["1", "2", "3"]
+    _write_events(journal, range(4, 6))
+    journal.close()
+
+    # The torn tail was cut off, so later entries stay readable on every resume.
+    for _ in range(2):
+        journal = Journal(path, resume=True)
+        assert sorted(journal.completed) == ["1", "2", "3", "4", "5"]
+        journal.close()
+    assert journal.completed["5"][0] == _event(5)
+    assert journal.completed["5"][1] == _divisions(5)
+
+
+def test_resume_skips_damaged_lines_mid_file(tmp_path):
+    path = str(tmp_path / "run.journal.jsonl")
+    journal = Journal(path)
+    _write_events(journal, [1])
+    journal.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"kind": "event", "key": "2", "resu{"kind": "division"}\n')
+    journal = Journal(path, resume=True)
+    _write_events(journal, [3])
+    journal.close()
+
+    assert sorted(Journal(path, resume=True).completed) == ["1", "3"]
+
+
+@pytest.fixture
+def server():
+    srv = serve(events=120, divisions=2)
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _run(server, out: str, journal: str, resume: bool):
+    scraper = AESScraper(delay_sec=0, base=server.url)
+    return scraper.run(
+        out,
+        workers=4,
+        fmt="jsonl",
+        journal_path=journal,
+        resume=resume,
+        progress_interval=0,
+    )
+
+
+def test_run_resumes_from_torn_journal(server, tmp_path):
+    out = str(tmp_path / "events.jsonl")
+    journal = str(tmp_path / "events.journal.jsonl")
+    full = _run(server, out, journal, resume=False)
+    assert full["events"] > 0
+
+    # Interrupt mid-write: keep the first half of the journal, torn mid-line.
+    with open(journal, "rb") as f:
+        data = f.read()
+    with open(journal, "wb") as f:
+        f.write(data[: len(data) // 2])
+
+    first = dict(server.stats)
+    resumed = _run(server, out, journal, resume=True)
+    assert resumed["events"] == full["events"]
+    assert server.stats["requests"] > first["requests"]
+
+    # A second resume restores everything and fetches nothing but the listing.
+    before = server.stats["requests"]
+    again = _run(server, out, journal, resume=True)
+    assert again["events"] == full["events"]
+    assert server.stats["requests"] - before == 1
+
+
+class _FailingListing(AESScraper):
+    """Listing that breaks after ``fail_after`` events, like a dropped connection."""
+
+    fail_after = 40
+
+    def iter_events(self, *args, **kwargs):
+        for n, event in enumerate(super().iter_events(*args, **kwargs)):
+            if n == self.fail_after:
+                raise ConnectionError("listing connection reset")
+            yield event
+
+
+def test_listing_failure_journals_every_finished_fetch(tmp_path):
+    srv = serve(events=120, divisions=2, scheduler_share=0, latency_ms=20)
+    try:
+        out = str(tmp_path / "events.jsonl")
+        journal = str(tmp_path / "events.journal.jsonl")
+        scraper = _FailingListing(delay_sec=0, base=srv.url)
+        with pytest.raises(ConnectionError):
+            scraper.run(
+                out, workers=4, fmt="jsonl", journal_path=journal, progress_interval=0
+            )
+        with open(journal, encoding="utf-8") as f:
+            journaled = sum(1 for _ in f)
+
+        # Queued fetches were cancelled, and every request that was made
+        # (all but the one listing page) reached the journal.
+        assert 0 < journaled < 2 * _FailingListing.fail_after
+        assert srv.stats["requests"] - 1 == journaled
+    finally:
+        srv.shutdown()
+        srv.server_close()
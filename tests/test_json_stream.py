@@ -0,0 +1,56 @@
+import json
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import iter_json_array  # noqa: E402
+
+
+def _chunked(data: bytes, sizes):
+    pos = 0
+    for size in sizes:
+        if pos >= len(data):
+            return
+        yield data[pos : pos + size]
+        pos += size
+    if pos < len(data):
+        yield data[pos:]
+
+
+@pytest.mark.parametrize("number", ["1.5e-3", "-2E+10", "12.0", "7"])
+def test_number_split_at_every_offset(number):
+    doc = f'{{"@odata.count": {number}, "value": [{number}, {number}]}}'.encode()
+    for cut in range(1, len(doc)):
+        meta = {}
+        items = list(iter_json_array([doc[:cut], doc[cut:]], "value", meta))
+        assert items == [json.loads(number)] * 2
+        assert meta == {"@odata.count": json.loads(number)}
+
+
+def test_random_chunking_matches_json_loads():
+    rng = random.Random(7)
+    for _ in range(300):
+        payload = {
+            "@odata.count": rng.uniform(-1e6, 1e6),
+            "value": [
+                rng.choice(
+                    [
+                        rng.uniform(-1e9, 1e9),
+                        rng.randint(-(10**12), 10**12),
+                        {"eventId": rng.randint(1, 10**6), "fee": rng.random()},
+                        "naïve ünïcode",
+                    ]
+                )
+                for _ in range(rng.randint(0, 12))
+            ],
+        }
+        data = json.dumps(payload).encode("utf-8")
+        sizes = [rng.randint(1, 8) for _ in range(len(data))]
+        meta = {}
+        items = list(iter_json_array(_chunked(data, sizes), "value", meta))
+        assert items == payload["value"]
+        assert meta == {"@odata.count": payload["@odata.count"]}